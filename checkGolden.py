@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import sys
+
+from redutor import Golden
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DESIGN = os.path.join(ROOT, "designs", "reference.json")
+DEFAULT_GOLDEN = os.path.join(ROOT, "golden", "reference.npz")
+
+
+def _tolerance(text: str):
+    pattern, _, values = text.partition("=")
+    rtol, _, atol = values.partition(",")
+    return pattern, (float(rtol), float(atol or 0))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compara os resultados do redutor de referência com o golden."
+    )
+    parser.add_argument("--design", default=DEFAULT_DESIGN, help="arquivo de projeto")
+    parser.add_argument("--golden", default=DEFAULT_GOLDEN, help="arquivo .npz")
+    parser.add_argument(
+        "--update", action="store_true", help="regrava o golden com os valores atuais"
+    )
+    parser.add_argument(
+        "--rtol", type=float, default=1e-9, help="tolerância relativa (padrão: 1e-9)"
+    )
+    parser.add_argument(
+        "--atol", type=float, default=0.0, help="tolerância absoluta (padrão: 0)"
+    )
+    parser.add_argument(
+        "--tolerance",
+        metavar="CAMPO=RTOL[,ATOL]",
+        type=_tolerance,
+        action="append",
+        default=[],
+        help="tolerância por campo, aceita curingas (ex.: '*Eixo*.N_fad=1e-6')",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="repetições para medir o tempo"
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.design, encoding="utf-8") as file:
+        data = json.load(file)
+    runs = [Golden.evaluate(data) for _ in range(args.repeat)]
+    design = runs[0][0]
+    for step in runs[0][1]:
+        best = min(timings[step] for _, timings in runs)
+        print(f"{step}: {best * 1000:.2f} ms")
+
+    fields = Golden.capture_reference(data, design)
+    if args.update:
+        os.makedirs(os.path.dirname(args.golden), exist_ok=True)
+        Golden.save(args.golden, fields)
+        print(f"Golden atualizado: {len(fields)} campos em {args.golden}")
+        return 0
+
+    failures = Golden.compare(
+        Golden.load(args.golden),
+        fields,
+        rtol=args.rtol,
+        atol=args.atol,
+        tolerances=dict(args.tolerance),
+    )
+    for failure in failures:
+        print(failure)
+    print(f"{len(fields)} campos comparados, {len(failures)} divergências")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import numpy as np
+
+# Rolamentos rigidos de esferas (catalogo SKF)
+# designacao, d [mm], D [mm], B [mm], C [kN], C0 [kN], massa [kg]
+CATALOGUE = (
+    ("6000", 10, 26, 8, 4.75, 1.96, 0.019),
+    ("6200", 10, 30, 9, 5.4, 2.36, 0.032),
+    ("6300", 10, 35, 11, 8.52, 3.4, 0.053),
+    ("6001", 12, 28, 8, 5.4, 2.36, 0.022),
+    ("6201", 12, 32, 10, 7.28, 3.1, 0.037),
+    ("6301", 12, 37, 12, 10.1, 4.15, 0.06),
+    ("6002", 15, 32, 9, 5.85, 2.85, 0.03),
+    ("6202", 15, 35, 11, 8.06, 3.75, 0.045),
+    ("6302", 15, 42, 13, 11.9, 5.4, 0.082),
+    ("6003", 17, 35, 10, 6.37, 3.25, 0.039),
+    ("6203", 17, 40, 12, 9.95, 4.75, 0.065),
+    ("6303", 17, 47, 14, 14.3, 6.55, 0.11),
+    ("6403", 17, 62, 17, 22.9, 10.8, 0.27),
+    ("6004", 20, 42, 12, 9.95, 5.0, 0.069),
+    ("6204", 20, 47, 14, 13.5, 6.55, 0.11),
+    ("6304", 20, 52, 15, 16.8, 7.8, 0.14),
+    ("6404", 20, 72, 19, 30.7, 15.0, 0.4),
+    ("6005", 25, 47, 12, 11.9, 6.55, 0.08),
+    ("6205", 25, 52, 15, 14.8, 7.8, 0.13),
+    ("6305", 25, 62, 17, 23.4, 11.6, 0.23),
+    ("6405", 25, 80, 21, 35.8, 19.3, 0.53),
+    ("6006", 30, 55, 13, 13.8, 8.3, 0.12),
+    ("6206", 30, 62, 16, 20.3, 11.2, 0.2),
+    ("6306", 30, 72, 19, 29.6, 16.0, 0.35),
+    ("6406", 30, 90, 23, 43.6, 24.0, 0.74),
+)
+
+
+class BearingSelection:
+    # Selecao em lote: cada entrada (ultimo eixo = mancais) recebe o
+    # rolamento mais leve com o furo do assento que atinge a vida L10h
+    def __init__(
+        self,
+        bore,
+        radial_load,
+        speed,
+        required_life,
+        static_safety: float = 1.0,
+        catalogue=CATALOGUE,
+    ) -> None:
+        self.bore = np.asarray(bore, dtype=float)  # m
+        self.radial_load = np.asarray(radial_load, dtype=float)  # N
+        self.speed = np.asarray(speed, dtype=float)  # rpm
+        self.required_life = required_life  # h
+        self.static_safety = static_safety
+
+        # Catalogo ordenado por furo e, dentro do furo, por massa
+        columns = list(zip(*catalogue))
+        d = np.array(columns[1], dtype=float)
+        mass = np.array(columns[6], dtype=float)
+        order = np.lexsort((mass, d))
+        self.designations = np.array(columns[0])[order]
+        self.d = d[order] / 1000
+        self.D = np.array(columns[2], dtype=float)[order] / 1000
+        self.B = np.array(columns[3], dtype=float)[order] / 1000
+        self.C = np.array(columns[4], dtype=float)[order] * 1000
+        self.C0 = np.array(columns[5], dtype=float)[order] * 1000
+        self.catalogue_mass = mass[order]
+
+    def _life(self, C: np.ndarray, P: np.ndarray, n: np.ndarray) -> np.ndarray:
+        # L10h = 10^6 / (60 n) (C / P)^3, esferas
+        with np.errstate(divide="ignore"):
+            return 1e6 / (60 * n) * (C / P) ** 3
+
+    def select(self):
+        # Faixa de cada furo no catalogo ordenado
+        bore = np.round(self.bore, 6)
+        first = np.searchsorted(self.d, bore, "left")[..., None]
+        last = np.searchsorted(self.d, bore, "right")[..., None]
+        k = np.arange(len(self.d))
+        P = np.abs(self.radial_load)[..., None]
+        life = self._life(self.C, P, self.speed[..., None])
+        fits = (
+            (k >= first)
+            & (k < last)
+            & (life >= np.asarray(self.required_life)[..., None])
+            & (self.C0 >= self.static_safety * P)
+        )
+        # Primeiro candidato valido da faixa = mais leve
+        self.valid = fits.any(axis=-1)
+        self.index = np.where(self.valid, np.argmax(fits, axis=-1), -1)
+        index = np.maximum(self.index, 0)
+        self.designation = np.where(self.valid, self.designations[index], "")
+        self.L10h = np.where(
+            self.valid, np.take_along_axis(life, index[..., None], -1)[..., 0], np.nan
+        )
+        self.mass = np.where(self.valid, self.catalogue_mass[index], np.nan)
+        with np.errstate(divide="ignore"):
+            static_factor = self.C0[index] / P[..., 0]
+        self.static_factor = np.where(self.valid, static_factor, np.nan)
+
+    def print_report(self, labels=None):
+        print("Rolamentos")
+        designation = np.atleast_1d(self.designation)
+        L10h = np.atleast_1d(self.L10h)
+        labels = labels or [str(i) for i in range(designation.shape[-1])]
+        for i, label in enumerate(labels):
+            if designation.ndim == 1:
+                name = designation[i] or "nenhum rolamento atende"
+                print(f"{label}: {name}, L10h={L10h[i]}")
+            else:
+                valid = self.valid[..., i]
+                print(f"{label}: {np.count_nonzero(valid)}/{valid.size} atendidos")
@@ -0,0 +1,659 @@
+import json
+import math
+import numbers
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from redutor.BearingSelection import BearingSelection
+from redutor.Gear import Gear
+from redutor.Gearbox import Gearbox
+from redutor.GearTransmission import GearTransmission
+from redutor.Keyway import Keyway
+from redutor.Material import Material
+from redutor.Pulley import Pulley
+from redutor.PulleyTransmission import PulleyTransmission
+from redutor.ResultCache import ResultCache
+from redutor.Shaft import Shaft
+from redutor.ShaftDynamics import ShaftDynamics
+from redutor.ShaftWorkspace import ShaftWorkspace
+from redutor.SystemVariables import SystemVariables
+
+# Chaves terminadas em "?" sao opcionais, "*" aceita qualquer nome
+SCHEMA = {
+    "system": {
+        "input_power": "number",
+        "input_velocity": "number",
+        "seconds_of_use": "number",
+        "roller_efficiency": "number",
+        "belt_efficiency": "number",
+    },
+    "materials": {
+        "*": {
+            "elasticity_module": "number",
+            "poisson_coef": "number",
+            "yield_stress": "number",
+            "ultimate_stress": "number",
+            "bending_stress_strength": "number",
+            "contact_stress_strength": "number",
+            "neuber_constant?": "number",
+            "neuber_constant_shear?": "number",
+            "density?": "number",
+        }
+    },
+    "pulley": {
+        "driver_diameter": "number",
+        "driven_diameter": "number",
+        "position": "number",
+        "belt_angle?": "number",
+    },
+    "gears": {
+        "*": {
+            "number_of_teeths": "number",
+            "pressure_angle": "number",
+            "modulo": "number",
+            "thickness_factor": "number",
+            "J_bending_stress": "number",
+            "material": "string",
+        }
+    },
+    "transmissions": {
+        "*": {
+            "gear1": "string",
+            "gear2": "string",
+            "position": "number",
+            "driven_by": "string",
+        }
+    },
+    "supports": {"Ra": "number", "Rb": "number"},
+    "shafts": [
+        {
+            "label": "string",
+            "length": "number",
+            "resolution": "integer",
+            "material": "string",
+            "sections": "pairs",
+            "loads": [
+                {
+                    "at": "reference",
+                    "gear?": "string",
+                    "x?": "reference",
+                    "y?": "reference",
+                    "z?": "reference",
+                }
+            ],
+            "torque": "reference",
+            "stress_focus": "pairs",
+        }
+    ],
+}
+
+GEARBOX_RESULTS = (
+    "mass",
+    "inertia",
+    "belt_loss",
+    "heat",
+    "efficiency",
+    "temperature_rise",
+    "oil_temperature",
+)
+
+DYNAMICS_RESULTS = (
+    "critical_rpm",
+    "speed_ratio",
+    "torsional_stiffness",
+    "twist",
+)
+
+TRANSMISSION_RESULTS = (
+    "w1",
+    "w2",
+    "p1",
+    "p2",
+    "T1",
+    "T2",
+    "Ft1",
+    "Ft2",
+    "Fn1",
+    "Fn2",
+    "sigma_b1",
+    "sigma_b2",
+    "sigma_c1",
+    "sigma_c2",
+    "CSb1",
+    "CSb2",
+    "CSc1",
+    "CSc2",
+)
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, (numbers.Real, np.ndarray))
+
+
+def _check_type(value: Any, kind: str) -> bool:
+    if kind == "number":
+        return _is_number(value)
+    if kind == "integer":
+        return isinstance(value, numbers.Integral) and not isinstance(value, bool)
+    if kind == "string":
+        return isinstance(value, str)
+    if kind == "reference":
+        return isinstance(value, str) or _is_number(value)
+    if kind == "pairs":
+        return isinstance(value, list) and all(
+            isinstance(pair, (list, tuple))
+            and len(pair) >= 2
+            and all(_is_number(item) for item in pair)
+            for pair in value
+        )
+    raise ValueError(f"Tipo de schema desconhecido: {kind}")
+
+
+def validate(data: Any, schema: Any = SCHEMA, path: str = "design") -> None:
+    if isinstance(schema, str):
+        if not _check_type(data, schema):
+            raise ValueError(f"{path}: esperado {schema}, recebido {data!r}")
+        return
+    if isinstance(schema, list):
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: esperado uma lista")
+        for i, item in enumerate(data):
+            validate(item, schema[0], f"{path}[{i}]")
+        return
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: esperado um objeto")
+    if "*" in schema:
+        for key, item in data.items():
+            validate(item, schema["*"], f"{path}.{key}")
+        return
+    fields = {key.rstrip("?"): key.endswith("?") for key in schema}
+    for key in data:
+        if key not in fields:
+            raise ValueError(f"{path}: campo desconhecido '{key}'")
+    for key, optional in fields.items():
+        if key not in data:
+            if not optional:
+                raise ValueError(f"{path}: campo obrigatorio '{key}' ausente")
+            continue
+        validate(data[key], schema[key + "?" if optional else key], f"{path}.{key}")
+
+
+class Design:
+    OUTPUTS = (
+        "reactions",
+        "keys",
+        "stresses",
+        "plots",
+        "gearbox",
+        "dynamics",
+        "bearings",
+    )
+
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        label: str = "design",
+        cache: Optional[ResultCache] = None,
+        workspace: Optional[ShaftWorkspace] = None,
+        dtype=np.float64,
+    ) -> None:
+        validate(data)
+        self.data = data
+        self.label = label
+        self.cache = cache
+        # Workspace compartilhado: cada eixo so vale ate o proximo ser
+        # calculado, entao resultados e graficos saem em calculate_stress
+        self.workspace = workspace
+        self.dtype = np.dtype(dtype)
+        self.system = SystemVariables(**data["system"])
+        self.materials = {
+            name: Material(**props) for name, props in data["materials"].items()
+        }
+        self.gears = {
+            name: Gear(
+                **{
+                    **props,
+                    "material": self._lookup(self.materials, props["material"]),
+                }
+            )
+            for name, props in data["gears"].items()
+        }
+        self.supports = data["supports"]
+        self.stages = {}
+        self.transmissions = {}
+        self.shafts = {}
+        self.reactions = {}
+        self.stage_inputs = {}
+        self.dynamics = {}
+        self.shaft_results = {}
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        cache: Optional[ResultCache] = None,
+        workspace: Optional[ShaftWorkspace] = None,
+        dtype=np.float64,
+    ) -> "Design":
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(
+            data,
+            label=os.path.splitext(os.path.basename(path))[0],
+            cache=cache,
+            workspace=workspace,
+            dtype=dtype,
+        )
+
+    def _cached(
+        self, kind: str, inputs: Any, target: Any, compute: Callable[[], None]
+    ) -> bool:
+        if self.cache is None:
+            compute()
+            return False
+        return self.cache.fetch(kind, inputs, target, compute)
+
+    @staticmethod
+    def _lookup(table: Dict[str, Any], name: str) -> Any:
+        if name not in table:
+            raise ValueError(f"Referencia desconhecida: '{name}'")
+        return table[name]
+
+    def _resolve(self, reference: Any) -> Any:
+        if not isinstance(reference, str):
+            return reference
+        negative = reference.startswith("-")
+        stage, _, attribute = reference.lstrip("-").partition(".")
+        value = getattr(self._lookup(self.stages, stage), attribute)
+        return -value if negative else value
+
+    def _position(self, at: Any) -> float:
+        if isinstance(at, str):
+            return self._lookup(self.stages, at).position
+        return at
+
+    def _stage_input(self, driven_by: str) -> Tuple[Any, Any]:
+        if driven_by == "pulley":
+            ratio = (
+                self.pulley.P2.primitive_diameter / self.pulley.P1.primitive_diameter
+            )
+            power = (
+                self.system.input_power
+                * self.system.roller_efficiency
+                * self.system.belt_efficiency
+            )
+            return power, self.system.input_velocity / ratio
+        previous = self._lookup(self.transmissions, driven_by)
+        return previous.p2, previous.w2 * 30 / math.pi
+
+    def calculate_transmissions(self, report: bool = True):
+        pulley = self.data["pulley"]
+        ratio = pulley["driven_diameter"] / pulley["driver_diameter"]
+        self.pulley = PulleyTransmission(
+            polia1=Pulley(
+                primitive_diameter=pulley["driver_diameter"],
+                input_velocity=self.system.input_velocity,
+            ),
+            polia2=Pulley(
+                primitive_diameter=pulley["driven_diameter"],
+                input_velocity=self.system.input_velocity / ratio,
+            ),
+            power=self.system.input_power,
+            position=pulley["position"],
+            belt_angle=pulley.get("belt_angle", 9.38),
+        )
+        self.pulley.calculate_transmission(report=report)
+        self.stages = {"pulley": self.pulley}
+        self.transmissions = {}
+
+        for name, spec in self.data["transmissions"].items():
+            transmission = GearTransmission(
+                gear1=self._lookup(self.gears, spec["gear1"]),
+                gear2=self._lookup(self.gears, spec["gear2"]),
+                seconds_of_use=self.system.seconds_of_use,
+                position=spec["position"],
+            )
+            input_power, input_velocity = self._stage_input(spec["driven_by"])
+            inputs = {
+                "gears": [transmission.gear1, transmission.gear2],
+                "seconds_of_use": transmission.seconds_of_use,
+                "position": transmission.position,
+                "input_power": input_power,
+                "input_velocity": input_velocity,
+                "roller_efficiency": self.system.roller_efficiency,
+            }
+            self._cached(
+                "gear_forces",
+                inputs,
+                transmission,
+                lambda: transmission.calculate_forces(
+                    input_power=input_power,
+                    input_velocity=input_velocity,
+                    roller_efficiency=self.system.roller_efficiency,
+                ),
+            )
+            self.stage_inputs[name] = inputs
+            self.stages[name] = transmission
+            self.transmissions[name] = transmission
+
+    @staticmethod
+    def _add_force(forces: Dict[float, Tuple], position: float, force: Tuple):
+        previous = forces.get(position, (0, 0, 0))
+        forces[position] = tuple(p + f for p, f in zip(previous, force))
+
+    def _solve_reactions(self, loads: Dict[float, Tuple]) -> Tuple[Tuple, Tuple]:
+        # Eixo bi-apoiado: somatorio de momentos em Rb e de forcas
+        Ra_distance = self.supports["Ra"]
+        Rb_distance = self.supports["Rb"]
+        Ra = []
+        Rb = []
+        for direction in range(3):
+            moment = 0
+            total = 0
+            for position, force in loads.items():
+                moment += force[direction] * (position - Rb_distance)
+                total += force[direction]
+            ra = -moment / (Ra_distance - Rb_distance)
+            Ra.append(ra)
+            Rb.append(-total - ra)
+        return tuple(Ra), tuple(Rb)
+
+    def calculate_reactions(self):
+        Ra_distance = self.supports["Ra"]
+        Rb_distance = self.supports["Rb"]
+        self.shafts = {}
+        self.reactions = {}
+
+        for spec in self.data["shafts"]:
+            loads = {}
+            for load in spec["loads"]:
+                self._add_force(
+                    loads,
+                    self._position(load["at"]),
+                    tuple(self._resolve(load.get(axis, 0)) for axis in "xyz"),
+                )
+            Ra, Rb = self._solve_reactions(loads)
+            acting_forces = dict(loads)
+            self._add_force(acting_forces, Rb_distance, Rb)
+            self._add_force(acting_forces, Ra_distance, Ra)
+            self.reactions[spec["label"]] = {"Ra": Ra, "Rb": Rb}
+
+            self.stage_inputs[spec["label"]] = {
+                "shaft": {
+                    key: spec[key]
+                    for key in ("length", "resolution", "sections", "stress_focus")
+                },
+                "material": self._lookup(self.data["materials"], spec["material"]),
+                "acting_forces": sorted(acting_forces.items()),
+                "correction_points": sorted([Rb_distance, Ra_distance]),
+                "torque": self._resolve(spec["torque"]),
+            }
+            if self.dtype != np.float64:
+                self.stage_inputs[spec["label"]]["dtype"] = self.dtype.name
+            self.shafts[spec["label"]] = Shaft(
+                length=spec["length"],
+                resolution=spec["resolution"],
+                material=self._lookup(self.materials, spec["material"]),
+                sections=spec["sections"],
+                acting_forces=acting_forces,
+                label=spec["label"],
+                correction_points=sorted([Rb_distance, Ra_distance]),
+                Torque=self._resolve(spec["torque"]),
+                stress_focus=spec["stress_focus"],
+                dtype=self.dtype,
+                workspace=self.workspace,
+            )
+
+    def calculate_stress(self, report: bool = True, plots: bool = False):
+        for name, transmission in self.transmissions.items():
+            hit = self._cached(
+                "gear_stress",
+                self.stage_inputs[name],
+                transmission,
+                lambda: transmission.calculate_stress(report=report),
+            )
+            if hit and report:
+                transmission._print_report()
+
+        for label, shaft in self.shafts.items():
+
+            def _compute():
+                shaft.calculate_acting_forces()
+                shaft.calculate_stress()
+
+            self._cached("shaft", self.stage_inputs[label], shaft, _compute)
+            # Consumidos antes do proximo eixo (que pode reusar o workspace)
+            self.shaft_results[label] = {
+                "N_est": float(np.nanmin(shaft.N_est)),
+                "N_fad": float(np.nanmin(shaft.N_fad)),
+            }
+            if plots:
+                shaft.export_plots()
+
+    def export_plots(self):
+        if self.workspace is not None:
+            raise ValueError(
+                "Com workspace os campos dos eixos nao sao mantidos: "
+                "use calculate_stress(plots=True)"
+            )
+        for shaft in self.shafts.values():
+            shaft.export_plots()
+
+    def evaluate(self, outputs: Iterable[str] = OUTPUTS):
+        outputs = set(outputs)
+        unknown = outputs - set(self.OUTPUTS)
+        if unknown:
+            raise ValueError(f"Saidas desconhecidas: {sorted(unknown)}")
+
+        report = "stresses" in outputs
+        self.calculate_transmissions(report=report)
+        self.calculate_reactions()
+        if "reactions" in outputs:
+            self.print_reactions()
+        if "keys" in outputs:
+            self.calculate_keys()
+        if "stresses" in outputs or "plots" in outputs:
+            self.calculate_stress(report=report, plots="plots" in outputs)
+        if "gearbox" in outputs:
+            self.calculate_gearbox()
+        if "dynamics" in outputs:
+            self.calculate_dynamics()
+        if "bearings" in outputs:
+            self.calculate_bearings()
+
+    def _hub_torque(self, spec: Dict[str, Any], focus: List[float]) -> Any:
+        # Torque da engrenagem montada no cubo; sem engrenagem, o do eixo
+        for load in spec["loads"]:
+            if "gear" in load and focus[0] <= self._position(load["at"]) <= focus[1]:
+                for name, transmission in self.transmissions.items():
+                    gears = self.data["transmissions"][name]
+                    if load["gear"] == gears["gear1"]:
+                        return transmission.T1
+                    if load["gear"] == gears["gear2"]:
+                        return transmission.T2
+        return self._resolve(spec["torque"])
+
+    def calculate_keys(self, feedback: bool = True, report: bool = True):
+        # Uma chaveta por trecho de stress_focus, todos os cubos de uma vez
+        self.key_labels = []
+        hubs = []
+        for spec in self.data["shafts"]:
+            shaft = self.shafts[spec["label"]]
+            for k, focus in enumerate(shaft.stress_focus):
+                index = shaft.section_index((focus[0] + focus[1]) / 2)
+                self.key_labels.append(f"{spec['label']}.{k}")
+                hubs.append(
+                    (
+                        shaft.sections[index][1],
+                        focus[1] - focus[0],
+                        self._hub_torque(spec, focus),
+                        shaft.material.yield_stress,
+                    )
+                )
+        columns = [np.broadcast_arrays(*column) for column in zip(*hubs)]
+        self.keys = Keyway(*[np.stack(column, axis=-1) for column in columns])
+        self.keys.calculate()
+        if report:
+            self.keys.print_report(self.key_labels)
+        if not feedback:
+            return
+        if np.ndim(self.keys.Kt) > 1:
+            # stress_focus guarda um Kt por trecho: em lote nao ha um so valor
+            raise ValueError(
+                "Kt/Kts das chavetas em lote nao realimentam os eixos: "
+                "use calculate_keys(feedback=False)"
+            )
+
+        # Kt e Kts do rasgo selecionado substituem os valores padrao
+        i = 0
+        for spec in self.data["shafts"]:
+            label = spec["label"]
+            shaft = self.shafts[label]
+            stress_focus = []
+            for focus in shaft.stress_focus:
+                Kt = self.keys.Kt[i]
+                Kts = self.keys.Kts[i]
+                if self.keys.valid[..., i]:
+                    focus = [focus[0], focus[1], float(Kt), float(Kts)]
+                stress_focus.append(focus)
+                i += 1
+            shaft.stress_focus = stress_focus
+            self.stage_inputs[label]["shaft"]["stress_focus"] = stress_focus
+
+    def calculate_gearbox(self, report: bool = True):
+        self.gearbox = Gearbox(self)
+        self.gearbox.calculate()
+        if report:
+            self.gearbox.print_report()
+
+    def calculate_dynamics(self, report: bool = True):
+        # Massas e rotacoes das engrenagens vem do redutor completo
+        if not hasattr(self, "gearbox"):
+            self.calculate_gearbox(report=False)
+        self.dynamics = {}
+        for spec in self.data["shafts"]:
+            label = spec["label"]
+            positions = [self._position(load["at"]) for load in spec["loads"]]
+            span = (min(positions), max(positions))
+            if span[0] == span[1]:
+                # Uma unica carga: o torque sai pela extremidade do eixo
+                span = (span[0], spec["length"])
+            dynamics = ShaftDynamics(
+                self.shafts[label],
+                masses={
+                    self._position(load["at"]): self.gearbox.masses[load["gear"]]
+                    for load in spec["loads"]
+                    if "gear" in load
+                },
+                speed=self.gearbox.speeds[label],
+                span=span,
+            )
+            dynamics.calculate()
+            if report:
+                dynamics.print_report()
+            self.dynamics[label] = dynamics
+
+    def calculate_bearings(self, required_life: float = None, report: bool = True):
+        # Todos os mancais de todos os eixos selecionados de uma vez
+        if not hasattr(self, "gearbox"):
+            self.calculate_gearbox(report=False)
+        if required_life is None:
+            required_life = self.system.seconds_of_use / 3600
+        self.bearing_labels = []
+        bores = []
+        loads = []
+        speeds = []
+        for label, shaft in self.shafts.items():
+            for support in ("Rb", "Ra"):
+                Fx, Fy, _ = self.reactions[label][support]
+                index = shaft.section_index(self.supports[support])
+                self.bearing_labels.append(f"{label}.{support}")
+                bores.append(shaft.sections[index][1])
+                loads.append((np.asarray(Fx) ** 2 + np.asarray(Fy) ** 2) ** 0.5)
+                speeds.append(np.asarray(self.gearbox.speeds[label]) * 30 / math.pi)
+        self.bearings = BearingSelection(
+            bore=np.stack(np.broadcast_arrays(*bores), axis=-1),
+            radial_load=np.stack(np.broadcast_arrays(*loads), axis=-1),
+            speed=np.stack(np.broadcast_arrays(*speeds), axis=-1),
+            required_life=required_life,
+        )
+        self.bearings.select()
+        if report:
+            self.bearings.print_report(self.bearing_labels)
+
+    def summary(self) -> Dict[str, Any]:
+        # Resultados escalares em tipos nativos (serializaveis em JSON)
+        result = {
+            "label": self.label,
+            "reactions": {
+                label: {
+                    support: [float(value) for value in force]
+                    for support, force in reactions.items()
+                }
+                for label, reactions in self.reactions.items()
+            },
+            "transmissions": {},
+            "shafts": {},
+        }
+        for name, transmission in self.transmissions.items():
+            result["transmissions"][name] = {
+                attribute: float(getattr(transmission, attribute))
+                for attribute in TRANSMISSION_RESULTS
+                if hasattr(transmission, attribute)
+            }
+        for label, results in self.shaft_results.items():
+            result["shafts"][label] = dict(results)
+        for label, dynamics in self.dynamics.items():
+            result["shafts"].setdefault(label, {}).update(
+                {
+                    attribute: float(getattr(dynamics, attribute))
+                    for attribute in DYNAMICS_RESULTS
+                }
+            )
+        if hasattr(self, "keys"):
+            result["keys"] = {
+                label: {
+                    "N_shear": float(np.min(self.keys.N_shear[..., i])),
+                    "N_bearing": float(np.min(self.keys.N_bearing[..., i])),
+                }
+                for i, label in enumerate(self.key_labels)
+            }
+        if hasattr(self, "bearings"):
+            result["bearings"] = {
+                label: {
+                    "designation": str(self.bearings.designation[..., i]),
+                    "L10h": float(self.bearings.L10h[..., i]),
+                }
+                for i, label in enumerate(self.bearing_labels)
+            }
+        if hasattr(self, "gearbox"):
+            result["gearbox"] = {
+                attribute: float(getattr(self.gearbox, attribute))
+                for attribute in GEARBOX_RESULTS
+            }
+        return result
+
+    def print_reactions(self):
+        for label, reactions in self.reactions.items():
+            Rax, Ray, _ = reactions["Ra"]
+            Rbx, Rby, _ = reactions["Rb"]
+            print(f"{label}: Rax : {Rax}, Ray : {Ray}, Rbx : {Rbx}, Rby : {Rby}")
+
+    def print_summary(self):
+        print(
+            f"Transmissão:\nw0={self.system.input_velocity * math.pi / 30}, "
+            f"P0={self.system.input_power}"
+        )
+        for i, transmission in enumerate(self.transmissions.values(), start=1):
+            if i == 1:
+                print(
+                    f"w{i}={transmission.w1}, P{i}={transmission.p1}, T{i}={transmission.T1}"
+                )
+            print(
+                f"w{i + 1}={transmission.w2}, P{i + 1}={transmission.p2}, "
+                f"T{i + 1}={transmission.T2}"
+            )
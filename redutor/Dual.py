@@ -0,0 +1,124 @@
+import operator
+
+import numpy as np
+
+# ufuncs usadas pelos estagios, mapeadas para a aritmetica dual
+_UFUNCS = {
+    np.add: operator.add,
+    np.subtract: operator.sub,
+    np.multiply: operator.mul,
+    np.true_divide: operator.truediv,
+    np.power: operator.pow,
+    np.negative: operator.neg,
+    np.square: lambda x: x**2,
+    np.sqrt: lambda x: x**0.5,
+}
+
+
+class Dual:
+    # Numero dual para derivada em modo direto: value tem forma (...),
+    # grad tem forma (..., P) com P parametros. Vetorizado em lotes.
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        # out e ignorado: o resultado dual e sempre um objeto novo
+        operation = _UFUNCS.get(ufunc)
+        if method != "__call__" or operation is None:
+            return NotImplemented
+        if ufunc is np.power:
+            return operation(self._lift(inputs[0]), inputs[1])
+        return operation(*[self._lift(x) for x in inputs])
+
+    def __init__(self, value, grad) -> None:
+        self.value = np.asarray(value, dtype=float)
+        self.grad = np.asarray(grad, dtype=float)
+
+    @classmethod
+    def variables(cls, **values) -> dict:
+        shape = np.broadcast(*values.values()).shape
+        seeds = np.eye(len(values))
+        return {
+            name: cls(
+                np.broadcast_to(value, shape),
+                np.broadcast_to(seeds[i], shape + (len(values),)),
+            )
+            for i, (name, value) in enumerate(values.items())
+        }
+
+    @property
+    def n_parameters(self) -> int:
+        return self.grad.shape[-1]
+
+    def _lift(self, other) -> "Dual":
+        if isinstance(other, Dual):
+            return other
+        value = np.asarray(other, dtype=float)
+        return Dual(value, np.zeros(value.shape + (self.n_parameters,)))
+
+    def __repr__(self) -> str:
+        return f"Dual(value={self.value}, grad={self.grad})"
+
+    def __getitem__(self, index) -> "Dual":
+        return Dual(self.value[index], self.grad[index])
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    def __neg__(self) -> "Dual":
+        return Dual(-self.value, -self.grad)
+
+    def __add__(self, other) -> "Dual":
+        other = self._lift(other)
+        return Dual(self.value + other.value, self.grad + other.grad)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> "Dual":
+        other = self._lift(other)
+        return Dual(self.value - other.value, self.grad - other.grad)
+
+    def __rsub__(self, other) -> "Dual":
+        return self._lift(other) - self
+
+    def __mul__(self, other) -> "Dual":
+        other = self._lift(other)
+        return Dual(
+            self.value * other.value,
+            self.grad * other.value[..., None] + other.grad * self.value[..., None],
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> "Dual":
+        other = self._lift(other)
+        return Dual(
+            self.value / other.value,
+            (self.grad * other.value[..., None] - other.grad * self.value[..., None])
+            / (other.value**2)[..., None],
+        )
+
+    def __rtruediv__(self, other) -> "Dual":
+        return self._lift(other) / self
+
+    def __pow__(self, exponent) -> "Dual":
+        if isinstance(exponent, Dual):
+            raise TypeError("Expoente dual nao suportado")
+        value = self.value**exponent
+        return Dual(
+            value, (exponent * self.value ** (exponent - 1))[..., None] * self.grad
+        )
+
+    def __rpow__(self, base) -> "Dual":
+        value = np.asarray(base, dtype=float) ** self.value
+        return Dual(value, (np.log(base) * value)[..., None] * self.grad)
+
+    def mean(self, axis=None, dtype=None, out=None, **kwargs) -> "Dual":
+        if axis is None:
+            return Dual(
+                self.value.mean(),
+                self.grad.reshape(-1, self.n_parameters).mean(axis=0),
+            )
+        return Dual(self.value.mean(axis=axis), self.grad.mean(axis=axis))
@@ -0,0 +1,216 @@
+import asyncio
+import concurrent.futures
+import contextlib
+import io
+import json
+import math
+import os
+from typing import Any, Dict, Iterable, List
+
+from redutor.Design import Design
+
+DEFAULT_PORT = 8765
+# Maior linha (pedido) aceita; o padrao do asyncio e de 64 KiB
+DEFAULT_LINE_LIMIT = 16 * 2**20
+
+
+def _warm_up():
+    # Executado uma vez em cada processo: os modulos do redutor ficam
+    # importados para todos os pedidos seguintes
+    import redutor  # noqa: F401
+
+
+def _evaluate_batch(requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    responses = []
+    for request in requests:
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                design = Design(request["design"], label=request.get("label", "design"))
+                design.evaluate(
+                    outputs=request.get("outputs", ["reactions", "stresses"])
+                )
+            responses.append({"status": "ok", "result": design.summary()})
+        except Exception as error:
+            responses.append(
+                {"status": "error", "error": f"{type(error).__name__}: {error}"}
+            )
+    return responses
+
+
+class EvaluationService:
+    # Servidor local (JSON por linha via TCP). Pedidos concorrentes sao
+    # agrupados em lotes e avaliados por processos ja aquecidos.
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        workers: int = None,
+        batch_window: float = 0.005,
+        max_batch: int = 32,
+        line_limit: int = DEFAULT_LINE_LIMIT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.line_limit = line_limit
+        self.batches = 0
+        self.requests = 0
+
+    async def start(self):
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            self.workers, initializer=_warm_up
+        )
+        # Os processos sao criados antes de aceitar conexoes; criados depois
+        # herdariam os sockets dos clientes e a conexao nunca fecharia
+        await asyncio.get_running_loop().run_in_executor(self._executor, _warm_up)
+        self._queue = asyncio.Queue()
+        self._batches = set()
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=self.line_limit
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+        self._dispatcher.cancel()
+        self._executor.shutdown()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Servico de avaliacao em {self.host}:{self.port}")
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        loop = asyncio.get_running_loop()
+        lock = asyncio.Lock()
+        replies = []
+        async for line in self._lines(reader):
+            if line is not None and not line.strip():
+                continue
+            future = loop.create_future()
+            request, error = {}, None
+            if line is None:
+                error = f"pedido maior que {self.line_limit} bytes"
+            else:
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as decode_error:
+                    error = f"JSON invalido: {decode_error}"
+                if not isinstance(request, dict):
+                    request, error = {}, "pedido deve ser um objeto"
+            if error is None:
+                await self._queue.put((request, future))
+            else:
+                future.set_result({"status": "error", "error": error})
+            replies.append(
+                asyncio.create_task(
+                    self._reply(writer, lock, request.get("id"), future)
+                )
+            )
+        await asyncio.gather(*replies)
+        writer.close()
+        await writer.wait_closed()
+
+    @staticmethod
+    async def _lines(reader: asyncio.StreamReader):
+        # Linhas do cliente; uma linha acima do limite e descartada ate o
+        # separador e aparece como None, sem perder os pedidos seguintes
+        while True:
+            try:
+                yield await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as error:
+                if error.partial:
+                    yield error.partial
+                return
+            except asyncio.LimitOverrunError as error:
+                try:
+                    while True:
+                        await reader.readexactly(error.consumed)
+                        try:
+                            await reader.readuntil(b"\n")
+                            break
+                        except asyncio.LimitOverrunError as overrun:
+                            error = overrun
+                except asyncio.IncompleteReadError:
+                    yield None
+                    return
+                yield None
+
+    async def _reply(self, writer, lock, request_id, future):
+        # Respostas saem na ordem em que ficam prontas, identificadas por id
+        response = {"id": request_id, **await future}
+        async with lock:
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Referencia mantida ate o fim: o loop guarda apenas referencias fracas
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch):
+        self.batches += 1
+        self.requests += len(batch)
+        # Cada parte do lote vai para um processo diferente
+        size = math.ceil(len(batch) / self.workers)
+        await asyncio.gather(
+            *(
+                self._run_chunk(batch[start : start + size])
+                for start in range(0, len(batch), size)
+            )
+        )
+
+    async def _run_chunk(self, chunk):
+        loop = asyncio.get_running_loop()
+        try:
+            responses = await loop.run_in_executor(
+                self._executor, _evaluate_batch, [request for request, _ in chunk]
+            )
+        except Exception as error:
+            responses = [{"status": "error", "error": repr(error)}] * len(chunk)
+        for (_, future), response in zip(chunk, responses):
+            future.set_result(response)
+
+
+async def evaluate_remote(
+    designs: Iterable[Dict[str, Any]],
+    outputs: Iterable[str] = ("reactions", "stresses"),
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+) -> List[Dict[str, Any]]:
+    # Envia todos os projetos por uma conexao e devolve as respostas na ordem
+    reader, writer = await asyncio.open_connection(host, port)
+    designs = list(designs)
+    for i, design in enumerate(designs):
+        request = {"id": i, "design": design, "outputs": list(outputs)}
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+    await writer.drain()
+    writer.write_eof()
+
+    responses = [None] * len(designs)
+    async for line in reader:
+        response = json.loads(line)
+        responses[response["id"]] = response
+    writer.close()
+    await writer.wait_closed()
+    return responses
@@ -141,9 +141,10 @@ class GearTransmission:
         print(f"Coeficiente de segurança de flexao pinhao: {self.CSb1}")
         print(f"Coeficiente de segurança de flexao coroa: {self.CSb2}")
 
-    def calculate_stress(self):
+    def calculate_stress(self, report: bool = True):
         self._calculate_bending_stress()
         self._calculate_contact_stress()
         self._calculate_bending_fatigue()
         self._calculate_contact_fatigue()
-        self._print_report()
+        if report:
+            self._print_report()
@@ -0,0 +1,134 @@
+import math
+from typing import Any
+
+import numpy as np
+
+
+class Gearbox:
+    # Massa, inercia e perdas do redutor completo a partir dos estagios ja
+    # calculados. Todas as grandezas aceitam arrays (lote de projetos).
+    def __init__(
+        self,
+        design: Any,
+        heat_transfer_coefficient: float = 15,
+        ambient_temperature: float = 25,
+        housing_area: float = None,
+    ) -> None:
+        self.design = design
+        self.heat_transfer_coefficient = heat_transfer_coefficient  # W/(m^2 K)
+        self.ambient_temperature = ambient_temperature  # C
+        self.housing_area = housing_area  # m^2, estimada se None
+
+    def _calculate_speeds(self):
+        # Velocidade angular de cada engrenagem e de cada eixo (rad/s)
+        self.w0 = self.design.system.input_velocity * math.pi / 30
+        self.gear_speeds = {}
+        for name, spec in self.design.data["transmissions"].items():
+            transmission = self.design.transmissions[name]
+            self.gear_speeds[spec["gear1"]] = transmission.w1
+            self.gear_speeds[spec["gear2"]] = transmission.w2
+        self.shaft_speeds = {}
+        for spec in self.design.data["shafts"]:
+            gears = [load["gear"] for load in spec["loads"] if "gear" in load]
+            if not gears:
+                raise ValueError(f"{spec['label']}: nenhuma engrenagem montada")
+            if gears[0] not in self.gear_speeds:
+                raise ValueError(
+                    f"{spec['label']}: engrenagem '{gears[0]}' fora das transmissoes"
+                )
+            self.shaft_speeds[spec["label"]] = self.gear_speeds[gears[0]]
+
+    def _calculate_masses(self):
+        # Engrenagens como discos cheios e eixos como cilindros escalonados
+        self.masses = {}
+        self.inertias = {}
+        self.speeds = {}
+        for name, w in self.gear_speeds.items():
+            gear = self.design.gears[name]
+            d = np.asarray(gear.primitive_diam)
+            mass = gear.material.density * math.pi / 4 * d**2 * gear.thickness
+            self.masses[name] = mass
+            self.inertias[name] = mass * d**2 / 8
+            self.speeds[name] = w
+
+        for label, shaft in self.design.shafts.items():
+            starts = [sec[0] for sec in shaft.sections]
+            ends = starts[1:] + [shaft.length]
+            mass = 0
+            inertia = 0
+            for (start, D), end in zip(shaft.sections, ends):
+                m = shaft.material.density * math.pi / 4 * np.asarray(D) ** 2
+                m = m * (np.asarray(end) - start)
+                mass = mass + m
+                inertia = inertia + m * np.asarray(D) ** 2 / 8
+            self.masses[label] = mass
+            self.inertias[label] = inertia
+            self.speeds[label] = self.shaft_speeds[label]
+
+        self.mass = sum(self.masses.values())
+        # Inercia refletida no eixo do motor: J (w / w0)^2
+        self.inertia = sum(
+            self.inertias[name] * (self.speeds[name] / self.w0) ** 2
+            for name in self.masses
+        )
+
+    def _calculate_losses(self):
+        system = self.design.system
+        # A correia dissipa fora da carcaca; dentro ficam mancais e engrenamentos
+        belt_output = system.input_power * system.belt_efficiency
+        self.belt_loss = system.input_power - belt_output
+        self.losses = {"input_bearing": belt_output * (1 - system.roller_efficiency)}
+        for name, transmission in self.design.transmissions.items():
+            self.losses[name] = transmission.p1 - transmission.p2
+        self.heat = sum(self.losses.values())
+        self.output_power = belt_output - self.heat
+        self.efficiency = self.output_power / system.input_power
+
+    def _estimate_housing_area(self):
+        # Caixa envolvendo os eixos em linha: largura pela soma das distancias
+        # entre centros, altura pela maior engrenagem, profundidade pelo eixo
+        transmissions = list(self.design.transmissions.values())
+        diameters = [
+            np.asarray(self.design.gears[name].primitive_diam)
+            for name in self.gear_speeds
+        ]
+        width = sum(
+            (np.asarray(t.gear1.primitive_diam) + t.gear2.primitive_diam) / 2
+            for t in transmissions
+        )
+        width = (
+            width
+            + np.asarray(transmissions[0].gear1.primitive_diam) / 2
+            + np.asarray(transmissions[-1].gear2.primitive_diam) / 2
+        )
+        height = np.maximum.reduce(np.broadcast_arrays(*diameters))
+        depth = max(shaft.length for shaft in self.design.shafts.values())
+        return 2 * (width * height + width * depth + height * depth)
+
+    def _calculate_temperature(self):
+        area = self.housing_area
+        if area is None:
+            area = self._estimate_housing_area()
+        self.area = area
+        self.temperature_rise = self.heat / (self.heat_transfer_coefficient * area)
+        self.oil_temperature = self.ambient_temperature + self.temperature_rise
+
+    def calculate(self):
+        self._calculate_speeds()
+        self._calculate_masses()
+        self._calculate_losses()
+        self._calculate_temperature()
+
+    def print_report(self):
+        print("Redutor")
+        for name, mass in self.masses.items():
+            print(f"{name}: massa={mass}, inercia={self.inertias[name]}")
+        print(f"Massa total: {self.mass}")
+        print(f"Inercia refletida na entrada: {self.inertia}")
+        print(f"Perda na correia (fora da carcaca): {self.belt_loss}")
+        for name, loss in self.losses.items():
+            print(f"Perda {name}: {loss}")
+        print(f"Calor gerado: {self.heat}\nRendimento: {self.efficiency}")
+        print(f"Area da carcaca: {self.area}")
+        print(f"Elevacao de temperatura: {self.temperature_rise}")
+        print(f"Temperatura do oleo: {self.oil_temperature}")
@@ -0,0 +1,166 @@
+import contextlib
+import fnmatch
+import io
+import numbers
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from redutor.Design import Design
+
+# Campos que cruzam o zero: perto do zero so o erro absoluto tem sentido.
+# Piso de atol por campo, na ordem (o primeiro padrao que casa vale)
+ZERO_CROSSING_ATOL = {
+    "*.V": 1e-6,  # N
+    "*.V[xyz]": 1e-6,
+    "*.R[ab]": 1e-6,
+    "*.M": 1e-7,  # N.m
+    "*.M[xyz]": 1e-7,
+    "*.sigma*": 1e-1,  # Pa
+    "*.tensao_alt": 1e-1,
+    "*.def_ang*": 1e-12,  # rad
+    "*.def_*": 1e-13,  # m
+    "*.static_deflection": 1e-15,
+    "*.z": 1e-12,
+}
+
+
+def _fields(prefix: str, value: Any, fields: Dict[str, np.ndarray]):
+    # Apenas resultados numericos; objetos e listas de entrada sao ignorados
+    if isinstance(value, bool):
+        return
+    if isinstance(value, (numbers.Real, np.ndarray, np.generic)):
+        array = np.asarray(value)
+        if array.dtype.kind in "fiu":
+            fields[prefix] = array
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _fields(f"{prefix}.{key}", item, fields)
+
+
+def capture(design: Design, prefix: str = "") -> Dict[str, np.ndarray]:
+    fields = {}
+    stages = {"pulley": design.pulley, **design.transmissions, **design.shafts}
+    if hasattr(design, "gearbox"):
+        stages["gearbox"] = design.gearbox
+    if hasattr(design, "bearings"):
+        stages["bearings"] = design.bearings
+    if hasattr(design, "keys"):
+        stages["keys"] = design.keys
+    for label, dynamics in design.dynamics.items():
+        stages[f"{label}.dynamics"] = dynamics
+    for name, stage in stages.items():
+        for attribute, value in vars(stage).items():
+            _fields(f"{prefix}{name}.{attribute}", value, fields)
+    for label, reactions in design.reactions.items():
+        for support, force in reactions.items():
+            _fields(f"{prefix}{label}.{support}", np.array(force, dtype=float), fields)
+    return fields
+
+
+def evaluate(
+    data: Dict[str, Any], feedback: bool = False
+) -> Tuple[Design, Dict[str, float]]:
+    # Avaliacao do redutor etapa por etapa, com tempos (s). Com feedback, o
+    # Kt/Kts das chavetas entra nas tensoes: chavetas antes das tensoes
+    timings = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        design = Design(data)
+        keys = (
+            "keys",
+            lambda: design.calculate_keys(feedback=feedback, report=False),
+        )
+        stresses = ("stresses", lambda: design.calculate_stress(report=False))
+        steps = (
+            ("transmissions", lambda: design.calculate_transmissions(report=False)),
+            ("reactions", design.calculate_reactions),
+            *((keys, stresses) if feedback else (stresses, keys)),
+            ("gearbox", lambda: design.calculate_gearbox(report=False)),
+            ("dynamics", lambda: design.calculate_dynamics(report=False)),
+            ("bearings", lambda: design.calculate_bearings(report=False)),
+        )
+        for name, step in steps:
+            start = time.perf_counter()
+            step()
+            timings[name] = time.perf_counter() - start
+    timings["total"] = sum(timings.values())
+    return design, timings
+
+
+def capture_reference(
+    data: Dict[str, Any], design: Design = None
+) -> Dict[str, np.ndarray]:
+    # Campos das duas avaliacoes: sem e com o Kt/Kts das chavetas nas tensoes
+    if design is None:
+        design, _ = evaluate(data)
+    feedback, _ = evaluate(data, feedback=True)
+    return {**capture(design), **capture(feedback, prefix="feedback.")}
+
+
+def save(path: str, fields: Dict[str, np.ndarray]):
+    np.savez_compressed(path, **fields)
+
+
+def load(path: str) -> Dict[str, np.ndarray]:
+    with np.load(path) as archive:
+        return {name: archive[name] for name in archive.files}
+
+
+def _tolerance(
+    name: str, rtol: float, atol: float, tolerances: Dict[str, Tuple[float, float]]
+) -> Tuple[float, float]:
+    for pattern, tolerance in tolerances.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            return tolerance
+    for pattern, floor in ZERO_CROSSING_ATOL.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            return rtol, max(atol, floor)
+    return rtol, atol
+
+
+def compare(
+    reference: Dict[str, np.ndarray],
+    current: Dict[str, np.ndarray],
+    rtol: float = 1e-9,
+    atol: float = 0.0,
+    tolerances: Dict[str, Tuple[float, float]] = None,
+) -> List[str]:
+    # Ponto a ponto, como np.isclose: |a - e| <= atol + rtol |e|
+    tolerances = tolerances or {}
+    failures = []
+    for name in sorted(set(reference) - set(current)):
+        failures.append(f"{name}: campo ausente")
+    for name in sorted(set(current) - set(reference)):
+        failures.append(f"{name}: campo novo")
+    for name in sorted(set(reference) & set(current)):
+        expected = reference[name]
+        actual = np.asarray(current[name])
+        if expected.shape != actual.shape:
+            failures.append(f"{name}: forma {actual.shape} != {expected.shape}")
+            continue
+        if not np.array_equal(np.isnan(expected), np.isnan(actual)):
+            failures.append(f"{name}: NaN em posicoes diferentes")
+            continue
+        infinite = np.isinf(expected)
+        if (
+            not np.array_equal(expected[infinite], actual[infinite])
+            or np.isinf(actual[~infinite]).any()
+        ):
+            failures.append(f"{name}: infinitos diferentes")
+            continue
+        finite = np.isfinite(expected)
+        if not finite.any():
+            continue
+        expected = expected[finite].astype(float)
+        actual = actual[finite].astype(float)
+        field_rtol, field_atol = _tolerance(name, rtol, atol, tolerances)
+        error = np.abs(actual - expected)
+        outside = error > field_atol + field_rtol * np.abs(expected)
+        if outside.any():
+            worst = np.argmax(np.where(outside, error, -1))
+            failures.append(
+                f"{name}: {outside.sum()} de {outside.size} valores fora, "
+                f"erro {error[worst]:.3e} em {expected[worst]:.6e}"
+            )
+    return failures
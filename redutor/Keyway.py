@@ -0,0 +1,79 @@
+import numpy as np
+
+# Chavetas paralelas DIN 6885 forma A
+# d acima de, d ate [mm], b [mm], h [mm], t1 (eixo) [mm], t2 (cubo) [mm], r [mm]
+KEY_TABLE = (
+    (6, 8, 2, 2, 1.2, 1.0, 0.16),
+    (8, 10, 3, 3, 1.8, 1.4, 0.16),
+    (10, 12, 4, 4, 2.5, 1.8, 0.25),
+    (12, 17, 5, 5, 3.0, 2.3, 0.25),
+    (17, 22, 6, 6, 3.5, 2.8, 0.25),
+    (22, 30, 8, 7, 4.0, 3.3, 0.4),
+    (30, 38, 10, 8, 5.0, 3.3, 0.4),
+    (38, 44, 12, 8, 5.0, 3.3, 0.6),
+    (44, 50, 14, 9, 5.5, 3.8, 0.6),
+    (50, 58, 16, 10, 6.0, 4.3, 0.6),
+    (58, 65, 18, 11, 7.0, 4.4, 0.6),
+)
+
+# Rasgo fresado de topo (Peterson): Kt e Kts em funcao de r/d
+KT_TABLE = (
+    (0.005, 0.01, 0.02, 0.03, 0.04, 0.05),
+    (2.70, 2.45, 2.14, 1.98, 1.88, 1.80),
+    (4.00, 3.50, 3.00, 2.75, 2.60, 2.50),
+)
+
+
+class Keyway:
+    # Chavetas de todos os cubos em lote (ultimo eixo = cubos)
+    def __init__(
+        self,
+        diameter,
+        length,
+        torque,
+        yield_stress,
+    ) -> None:
+        self.diameter = np.asarray(diameter, dtype=float)  # m
+        self.length = np.asarray(length, dtype=float)  # m
+        self.torque = np.asarray(torque, dtype=float)  # N.m
+        self.yield_stress = yield_stress
+
+    def _select_geometry(self):
+        columns = np.array(KEY_TABLE, dtype=float)
+        d = np.round(self.diameter * 1000, 6)
+        index = np.searchsorted(columns[:, 1], d, "left")
+        self.valid = (d > columns[0, 0]) & (index < len(columns))
+        row = columns[np.minimum(index, len(columns) - 1)] / 1000
+        self.b, self.h, self.t1, self.t2, self.r = np.moveaxis(row[..., 2:], -1, 0)
+
+    def _calculate_stress(self):
+        T = np.abs(self.torque)
+        self.tau = 2 * T / (self.diameter * self.b * self.length)
+        # Esmagamento na parte da chaveta que fica no cubo
+        self.sigma = 2 * T / (self.diameter * self.length * (self.h - self.t1))
+        self.N_shear = 0.577 * self.yield_stress / self.tau
+        self.N_bearing = self.yield_stress / self.sigma
+
+    def _concentration_factors(self):
+        ratio = self.r / self.diameter
+        self.Kt = np.interp(ratio, KT_TABLE[0], KT_TABLE[1])
+        self.Kts = np.interp(ratio, KT_TABLE[0], KT_TABLE[2])
+
+    def calculate(self):
+        self._select_geometry()
+        self._calculate_stress()
+        self._concentration_factors()
+
+    def print_report(self, labels):
+        # Em lote, o menor coeficiente de seguranca de cada cubo
+        print("Chavetas")
+        for i, label in enumerate(labels):
+            if not self.valid[..., i].all():
+                print(f"{label}: diametro fora da tabela")
+                continue
+            print(
+                f"{label}: b x h = {self.b[..., i] * 1000} x {self.h[..., i] * 1000} mm, "
+                f"N_cis={np.min(self.N_shear[..., i])}, "
+                f"N_esm={np.min(self.N_bearing[..., i])}, "
+                f"Kt={self.Kt[..., i]}, Kts={self.Kts[..., i]}"
+            )
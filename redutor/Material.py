@@ -9,6 +9,7 @@ class Material:
         contact_stress_strength: float,
         neuber_constant: float = 0.062,
         neuber_constant_shear: float = 0.049,
+        density: float = 7850,
     ) -> None:
         self.elasticity_module = elasticity_module
         self.poisson_coef = poisson_coef
@@ -19,3 +20,4 @@ class Material:
         self.contact_stress_strength = contact_stress_strength
         self.neuber_constant = neuber_constant * 25.4**0.5  # mm^1/2
         self.neuber_constant_shear = neuber_constant_shear * 25.4**0.5  # mm^1/2
+        self.density = density  # kg/m^3
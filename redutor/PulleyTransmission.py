@@ -1,16 +1,24 @@
 import math
 
+import numpy as np
+
 from redutor import Pulley
 
 
 class PulleyTransmission:
     def __init__(
-        self, polia1: Pulley, polia2: Pulley, power: float, position: float
+        self,
+        polia1: Pulley,
+        polia2: Pulley,
+        power: float,
+        position: float,
+        belt_angle: float = 9.38,
     ) -> None:
         self.P1 = polia1
         self.P2 = polia2
         self.power = power
         self.position = position
+        self.belt_angle = math.radians(belt_angle)
 
     def _calculate_geometry(self):
         # Dimensionamento da transmissao pela correia
@@ -39,13 +47,16 @@ class PulleyTransmission:
         T = self.power / self.P1.angular_velocity
         self.F2 = (self.Fc - 2 * T / self.P1.primitive_diameter - self.Fc * e) / (1 - e)
         self.F1 = self.F2 + 2 * T / self.P1.primitive_diameter
+        # Carga da correia projetada no eixo
+        proj = math.cos(self.belt_angle)
+        self.Ty = -(self.F1 * proj + self.F2 * proj)
 
     def _calculate_durability(self):
         V = self.P1.angular_velocity * self.P1.primitive_diameter / 2
         T1 = self.F1 + self.Kb / self.P1.primitive_diameter
         T2 = self.F1 + self.Kb / self.P2.primitive_diameter
         Np = (self.K / T1) ** (-self.b) + (self.K / T2) ** (-self.b)  # ** (-1)
-        Np = Np if Np < 10e9 else 10e9
+        Np = np.minimum(Np, 10e9)
         self.t = Np * (math.pi * self.P1.primitive_diameter) / (720 * V)
 
     def _print_report(self):
@@ -54,9 +65,10 @@ class PulleyTransmission:
         print(f"Forças calculadas\nF1: {self.F1}\nF2: {self.F2}\nFc: {self.Fc}")
         print(f"Vida da correia: {self.t}")
 
-    def calculate_transmission(self):
+    def calculate_transmission(self, report: bool = True):
         self._calculate_geometry()
         self._input_constants()
         self._calculate_forces()
         self._calculate_durability()
-        self._print_report()
+        if report:
+            self._print_report()
@@ -0,0 +1,176 @@
+import concurrent.futures
+import contextlib
+import copy
+import io
+import math
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from redutor.Design import Design
+from redutor.ShaftWorkspace import ShaftWorkspace
+
+# Coeficientes de variacao padrao (distribuicao lognormal)
+DEFAULT_SCATTER = {
+    "yield_stress": 0.05,
+    "ultimate_stress": 0.05,
+    "bending_stress_strength": 0.08,
+    "contact_stress_strength": 0.08,
+    "input_power": 0.10,
+    "input_velocity": 0.02,
+}
+SYSTEM_VARIABLES = ("input_power", "input_velocity")
+MATERIAL_VARIABLES = (
+    "yield_stress",
+    "ultimate_stress",
+    "bending_stress_strength",
+    "contact_stress_strength",
+)
+GEAR_CRITERIA = ("CSb1", "CSb2", "CSc1", "CSc2")
+SHAFT_CRITERIA = ("N_est", "N_fad")
+
+
+def _lognormal(rng: np.random.Generator, mean: float, cv: float, size: int):
+    sigma = math.sqrt(math.log(1 + cv**2))
+    return rng.lognormal(math.log(mean) - sigma**2 / 2, sigma, size)
+
+
+def _evaluate_chunk(
+    data: Dict[str, Any],
+    scatter: Dict[str, float],
+    check_points: Dict[str, np.ndarray],
+    seed: np.random.SeedSequence,
+    size: int,
+) -> Dict[str, int]:
+    rng = np.random.default_rng(seed)
+    data = copy.deepcopy(data)
+    for name, cv in scatter.items():
+        if name in SYSTEM_VARIABLES:
+            data["system"][name] = _lognormal(rng, data["system"][name], cv, size)
+        else:
+            for props in data["materials"].values():
+                props[name] = _lognormal(rng, props[name], cv, size)
+
+    failures = {}
+    # Os relatorios impressos pelos estagios nao interessam aqui
+    with contextlib.redirect_stdout(io.StringIO()):
+        design = Design(data)
+        design.calculate_transmissions(report=False)
+        design.calculate_reactions()
+
+        for name, transmission in design.transmissions.items():
+            transmission.calculate_stress(report=False)
+            for criterion in GEAR_CRITERIA:
+                failures[f"{name}.{criterion}"] = getattr(transmission, criterion) < 1
+
+        for label, shaft in design.shafts.items():
+            points = check_points[label]
+            material = copy.copy(shaft.material)
+            for name in MATERIAL_VARIABLES:
+                setattr(material, name, np.asarray(getattr(material, name))[..., None])
+            sample = shaft.stress_at(
+                points,
+                shaft.moments_at(points),
+                material=material,
+                Torque=np.asarray(shaft.Torque)[..., None],
+            )
+            for criterion in SHAFT_CRITERIA:
+                failures[f"{label}.{criterion}"] = (getattr(sample, criterion) < 1).any(
+                    axis=-1
+                )
+
+    failures = {
+        name: np.broadcast_to(failed, (size,)) for name, failed in failures.items()
+    }
+    failures["system"] = np.logical_or.reduce(list(failures.values()))
+    return {name: int(failed.sum()) for name, failed in failures.items()}
+
+
+def wilson_interval(failures: int, samples: int, z: float = 1.96) -> Tuple:
+    p = failures / samples
+    denominator = 1 + z**2 / samples
+    center = (p + z**2 / (2 * samples)) / denominator
+    half = (
+        z * math.sqrt(p * (1 - p) / samples + z**2 / (4 * samples**2)) / denominator
+    )
+    return p, max(0.0, center - half), min(1.0, center + half)
+
+
+class Reliability:
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        scatter: Dict[str, float] = None,
+        seed: int = 0,
+    ) -> None:
+        self.data = data
+        self.scatter = DEFAULT_SCATTER if scatter is None else scatter
+        unknown = set(self.scatter) - set(SYSTEM_VARIABLES + MATERIAL_VARIABLES)
+        if unknown:
+            raise ValueError(f"Variaveis desconhecidas: {sorted(unknown)}")
+        self.seed = seed
+        self.check_points = self._find_check_points()
+
+    def _find_check_points(self) -> Dict[str, np.ndarray]:
+        # Secoes criticas do projeto nominal: minimo de N_est e N_fad em cada
+        # trecho entre mudancas de diametro, concentradores e cargas. Um so
+        # workspace para todos os eixos: cada um e consumido antes do proximo
+        with contextlib.redirect_stdout(io.StringIO()):
+            design = Design(copy.deepcopy(self.data), workspace=ShaftWorkspace())
+            design.calculate_transmissions(report=False)
+            design.calculate_reactions()
+
+        check_points = {}
+        for label, shaft in design.shafts.items():
+            with contextlib.redirect_stdout(io.StringIO()):
+                shaft.calculate_acting_forces()
+                shaft.calculate_stress()
+            edges = sorted(
+                {sec[0] for sec in shaft.sections}
+                | {bound for focus in shaft.stress_focus for bound in focus[:2]}
+                | set(shaft.acting_forces)
+            )
+            segment = np.searchsorted(edges, shaft.z, side="right")
+            points = set()
+            for s in np.unique(segment):
+                index = np.flatnonzero(segment == s)
+                for criterion in (shaft.N_est, shaft.N_fad):
+                    values = np.asarray(criterion)[index]
+                    if np.isfinite(values).any():
+                        points.add(shaft.z[index[np.nanargmin(values)]])
+            check_points[label] = np.array(sorted(points))
+        return check_points
+
+    def run(
+        self, samples: int = 1_000_000, workers: int = None, chunk_size: int = 50_000
+    ) -> Dict[str, Tuple[float, float, float]]:
+        sizes = [chunk_size] * (samples // chunk_size)
+        if samples % chunk_size:
+            sizes.append(samples % chunk_size)
+        # Uma semente independente por lote: resultado nao depende de workers
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        args = [
+            (self.data, self.scatter, self.check_points, seed, size)
+            for seed, size in zip(seeds, sizes)
+        ]
+
+        if workers == 1:
+            counts = [_evaluate_chunk(*arg) for arg in args]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                counts = list(executor.map(_evaluate_chunk, *zip(*args)))
+
+        self.samples = samples
+        self.failures = {
+            name: sum(count[name] for count in counts) for name in counts[0]
+        }
+        self.results = {
+            name: wilson_interval(failures, samples)
+            for name, failures in self.failures.items()
+        }
+        return self.results
+
+    def print_report(self):
+        print(f"Probabilidade de falha ({self.samples} amostras, IC 95%):")
+        for name, (p, lo, hi) in self.results.items():
+            print(f"{name}: {p:.3e} [{lo:.3e}, {hi:.3e}]")
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+# Incrementar quando as formulas dos estagios mudarem
+CACHE_VERSION = 1
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    raise TypeError(f"Valor nao serializavel: {value!r}")
+
+
+class ResultCache:
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(kind: str, inputs: Any) -> str:
+        payload = json.dumps(
+            [CACHE_VERSION, kind, inputs], sort_keys=True, default=_encode
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                results = {
+                    name: data[name].item() if data[name].ndim == 0 else data[name]
+                    for name in data.files
+                }
+        except (OSError, ValueError):
+            return None
+        # LRU: o tempo de modificacao marca o ultimo acesso
+        os.utime(path)
+        return results
+
+    def store(self, key: str, results: Dict[str, Any]):
+        arrays = {name: np.asarray(value) for name, value in results.items()}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            np.savez_compressed(file, **arrays)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz"):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def fetch(
+        self, kind: str, inputs: Any, target: Any, compute: Callable[[], None]
+    ) -> bool:
+        # Restaura em target os atributos produzidos por compute()
+        key = self.key(kind, inputs)
+        results = self.load(key)
+        if results is not None:
+            self.hits += 1
+            target.__dict__.update(results)
+            return True
+
+        self.misses += 1
+        before = dict(target.__dict__)
+        compute()
+        self.store(
+            key,
+            {
+                name: value
+                for name, value in target.__dict__.items()
+                if before.get(name) is not value
+            },
+        )
+        return False
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def print_stats(self):
+        print(
+            f"Cache: {self.hits} acertos, {self.misses} falhas, "
+            f"taxa de acerto {self.hit_rate:.1%}"
+        )
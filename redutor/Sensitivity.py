@@ -0,0 +1,96 @@
+import math
+from typing import Dict
+
+import numpy as np
+
+from redutor.Dual import Dual
+from redutor.Gear import Gear
+from redutor.GearTransmission import GearTransmission
+from redutor.Shaft import Shaft
+
+GEAR_PARAMETERS = (
+    "modulo",
+    "thickness_factor1",
+    "thickness_factor2",
+    "number_of_teeths1",
+    "number_of_teeths2",
+)
+GEAR_RESULTS = (
+    "sigma_b1",
+    "sigma_b2",
+    "sigma_c1",
+    "sigma_c2",
+    "CSb1",
+    "CSb2",
+    "CSc1",
+    "CSc2",
+)
+SHAFT_RESULTS = ("sigma_eq", "N_est", "N_fad")
+
+
+def gear_sensitivity(
+    transmission: GearTransmission,
+    input_power: float,
+    input_velocity: float,
+    roller_efficiency: float,
+    **values,
+) -> Dict[str, Dual]:
+    # Valores e gradientes dos coeficientes de seguranca em relacao a
+    # GEAR_PARAMETERS. Arrays em values avaliam um lote em uma passada.
+    unknown = set(values) - set(GEAR_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parametros desconhecidos: {sorted(unknown)}")
+
+    pinion = transmission.gear1
+    crown = transmission.gear2
+    base = {
+        "modulo": pinion.modulo,
+        "thickness_factor1": pinion.thickness / pinion.modulo,
+        "thickness_factor2": crown.thickness / crown.modulo,
+        "number_of_teeths1": pinion.number_of_teeths,
+        "number_of_teeths2": crown.number_of_teeths,
+    }
+    base.update(values)
+    params = Dual.variables(**base)
+
+    dual_transmission = GearTransmission(
+        gear1=Gear(
+            number_of_teeths=params["number_of_teeths1"],
+            pressure_angle=math.degrees(pinion.pressure_angle),
+            modulo=params["modulo"],
+            thickness_factor=params["thickness_factor1"],
+            J_bending_stress=pinion.J,
+            material=pinion.material,
+        ),
+        gear2=Gear(
+            number_of_teeths=params["number_of_teeths2"],
+            pressure_angle=math.degrees(crown.pressure_angle),
+            modulo=params["modulo"],
+            thickness_factor=params["thickness_factor2"],
+            J_bending_stress=crown.J,
+            material=crown.material,
+        ),
+        seconds_of_use=transmission.seconds_of_use,
+        position=transmission.position,
+    )
+    dual_transmission.calculate_forces(
+        input_power=input_power,
+        input_velocity=input_velocity,
+        roller_efficiency=roller_efficiency,
+    )
+    dual_transmission.calculate_stress(report=False)
+    return {name: getattr(dual_transmission, name) for name in GEAR_RESULTS}
+
+
+def shaft_sensitivity(shaft: Shaft, points=None) -> Dict[str, Dual]:
+    # Gradientes em relacao ao diametro de cada secao (uma coluna por secao)
+    # nos pontos pedidos. Os momentos independem do diametro (isostatico).
+    points = shaft.z if points is None else np.atleast_1d(np.asarray(points, float))
+    index = shaft.section_index(points)
+    diameters = np.array([sec[1] for sec in shaft.sections], dtype=float)
+    seeds = np.eye(len(diameters))
+
+    sample = shaft.stress_at(
+        points, shaft.moments_at(points), Diam=Dual(diameters[index], seeds[index])
+    )
+    return {name: getattr(sample, name) for name in SHAFT_RESULTS}
@@ -1,11 +1,15 @@
 import collections
+import copy
 import math
 from typing import Dict, List, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from redutor import Material
+from redutor.ShaftWorkspace import ShaftWorkspace
+
+# Pontos por bloco no calculo da linha elastica sobre a malha
+DEFLECTION_CHUNK = 256
 
 
 class Shaft:
@@ -20,185 +24,384 @@ class Shaft:
         correction_points: Tuple[float, float],
         Torque: float,
         stress_focus: List[Tuple[float, float]],
+        dtype=np.float64,
+        workspace: ShaftWorkspace = None,
     ) -> None:
+        self.dtype = np.dtype(dtype)
+        if workspace is not None and workspace.dtype != self.dtype:
+            raise ValueError(f"Workspace em {workspace.dtype}, eixo em {self.dtype}")
+        self.workspace = workspace
         self.stress_focus = stress_focus
         self.Torque = Torque
         self.correction_points = correction_points
         self.label = label
-        self.z = np.array(
-            [i for i in np.arange(0, length + length / resolution, 1 / resolution)]
+        self.length = length
+        self.sections = sorted([list(sec) for sec in sections])
+        self.resolution = resolution
+        # Trechos, cargas e concentradores sao localizados na malha em float64;
+        # so os arrays guardados usam o dtype do eixo
+        z = self._exact_grid()
+        index = self.section_index(z)
+        diameters = np.array([sec[1] for sec in self.sections])
+        self.z = z.astype(self.dtype, copy=False)
+        self.Diam = np.where(index >= 0, diameters[np.maximum(index, 0)], 0).astype(
+            self.dtype
         )
-        d = []
-        for pos in self.z:
-            diameter = 0
-            for i, sec in enumerate(sections):
-                if i == (len(sections) - 1):
-                    diameter = sec[1] if pos >= sec[0] else diameter
-                else:
-                    diameter = (
-                        sec[1]
-                        if pos < sections[i + 1][0] and pos >= sec[0]
-                        else diameter
-                    )
-            d.append(diameter)
-        self.Diam = np.array(d)
         self.material = material
-        self.J = np.array([math.pi * diam**4 / 32 for diam in self.Diam])
-        self.I = np.array([math.pi * diam**4 / 64 for diam in self.Diam])
+        self.J = math.pi * self.Diam**4 / 32
+        self.I = math.pi * self.Diam**4 / 64
         self.acting_forces = collections.OrderedDict(sorted(acting_forces.items()))
 
-    def _correct_deflection(self):
-        index0 = np.where(self.z == self.correction_points[0])[0]
-        index1 = np.where(self.z == self.correction_points[1])[0]
-        C3x = math.atan(
-            (self.def_x[index1] - self.def_x[index0])
-            / (self.correction_points[1] - self.correction_points[0])
+    def _exact_grid(self) -> np.ndarray:
+        # Malha em float64 (a propria z quando ja esta em float64)
+        z = getattr(self, "z", None)
+        if z is not None and z.dtype == np.float64:
+            return z
+        return np.arange(
+            0, self.length + self.length / self.resolution, 1 / self.resolution
         )
-        C3y = math.atan(
-            (self.def_y[index1] - self.def_y[index0])
-            / (self.correction_points[1] - self.correction_points[0])
+
+    def _buffer(self, name: str) -> np.ndarray:
+        # Buffer do workspace ou None (a operacao aloca um array novo)
+        if self.workspace is None:
+            return None
+        previous = self.workspace.owner
+        if previous is not self:
+            if previous is not None:
+                previous._release_workspace()
+            self.workspace.owner = self
+        return self.workspace.field(name, len(self.z))
+
+    def _release_workspace(self):
+        # Outro eixo passou a usar o workspace: os campos deste eixo seriam
+        # sobrescritos, entao sao removidos em vez de ficarem errados
+        for name, value in list(vars(self).items()):
+            if isinstance(value, np.ndarray) and np.may_share_memory(
+                value, self.workspace.buffer
+            ):
+                delattr(self, name)
+
+    def _empty(self, name: str) -> np.ndarray:
+        buffer = self._buffer(name)
+        return np.empty(len(self.z), dtype=self.dtype) if buffer is None else buffer
+
+    def _magnitude(self, name: str, components) -> np.ndarray:
+        result = np.square(components[0], out=self._empty(name))
+        term = self._empty("scratch0")
+        for component in components[1:]:
+            np.square(component, out=term)
+            np.add(result, term, out=result)
+        return np.sqrt(result, out=result)
+
+    def _integrate(self, y: np.ndarray, dz: np.ndarray, name: str) -> np.ndarray:
+        # Regra do trapezio acumulada
+        result = self._empty(name)
+        result[0] = 0
+        np.add(y[:-1], y[1:], out=result[1:])
+        np.multiply(result[1:], dz, out=result[1:])
+        np.divide(result[1:], 2, out=result[1:])
+        np.cumsum(result[1:], out=result[1:])
+        return result
+
+    def _correct_deflection(self):
+        # Linha elastica corrigida (deflexao nula nos mancais) pelo metodo
+        # analitico; def_* e def_ang_* seguem a integracao na malha
+        for axis in "xyz":
+            setattr(self, f"def_tot_cor_{axis}", self._empty(f"def_tot_cor_{axis}"))
+            setattr(self, f"def_ang_cor_{axis}", self._empty(f"def_ang_cor_{axis}"))
+        # Em blocos de pontos: os temporarios nao crescem com a resolucao
+        for start in range(0, len(self.z), DEFLECTION_CHUNK):
+            chunk = slice(start, start + DEFLECTION_CHUNK)
+            slope, deflection = self.deflection_at(self.z[chunk])
+            for i, axis in enumerate("xyz"):
+                getattr(self, f"def_tot_cor_{axis}")[chunk] = deflection[i]
+                getattr(self, f"def_ang_cor_{axis}")[chunk] = slope[i]
+
+        self.def_tot_cor = self._magnitude(
+            "def_tot_cor",
+            (self.def_tot_cor_x, self.def_tot_cor_y, self.def_tot_cor_z),
         )
-        C3z = math.atan(
-            (self.def_z[index1] - self.def_z[index0])
-            / (self.correction_points[1] - self.correction_points[0])
+        self.def_ang_cor = self._magnitude(
+            "def_ang_cor",
+            (self.def_ang_cor_x, self.def_ang_cor_z, self.def_ang_cor_y),
         )
-        self.def_tot_cor_x = self.def_x - C3x * self.def_x
-        self.def_tot_cor_y = self.def_y - C3y * self.def_y
-        self.def_tot_cor_z = self.def_z - C3z * self.def_z
-        self.def_tot_cor = (
-            self.def_tot_cor_x**2 + self.def_tot_cor_y**2 + self.def_tot_cor_z**2
-        ) ** 0.5
-
-        self.def_ang_cor_x = self.def_ang_x - C3x
-        self.def_ang_cor_y = self.def_ang_y - C3y
-        self.def_ang_cor_z = self.def_ang_z - C3z
-        self.def_ang_cor = (
-            self.def_ang_cor_x**2 + self.def_ang_cor_z**2 + self.def_ang_cor_y**2
-        ) ** 0.5
 
     def _calculate_deflection(self):
-        def _mod_trap_int(x, y) -> np.ndarray:
-            result = [0]
-            for i in range(0, len(x) - 1):
-                value = result[i] + (y[i] + y[i + 1]) * (x[i + 1] - x[i]) / 2
-                result.append(value)
-            # print(result)
-            return np.array(result)
-
-        Iz = self.material.elasticity_module * self.I
-        M_Ei_x = [mx / iz for mx, iz in zip(self.Mx, Iz)]
-        M_Ei_y = [my / iz for my, iz in zip(self.My, Iz)]
-        M_Ei_z = [mz / iz for mz, iz in zip(self.Mz, Iz)]
-        self.def_ang_x = _mod_trap_int(self.z, M_Ei_x)
-        self.def_x = _mod_trap_int(self.z, self.def_ang_x)
-        self.def_ang_y = _mod_trap_int(self.z, M_Ei_y)
-        self.def_y = _mod_trap_int(self.z, self.def_ang_y)
-        self.def_ang_z = _mod_trap_int(self.z, M_Ei_z)
-        self.def_z = _mod_trap_int(self.z, self.def_ang_z)
-        self.def_ang = [
-            (dx**2 + dy**2 + dz**2) ** 0.5
-            for dx, dy, dz in zip(self.def_ang_x, self.def_ang_y, self.def_ang_z)
-        ]
+        Iz = np.multiply(
+            self.material.elasticity_module, self.I, out=self._empty("scratch1")
+        )
+        dz = np.subtract(self.z[1:], self.z[:-1], out=self._empty("scratch2")[:-1])
+        M_Ei = self._empty("scratch0")
+        for axis in "xyz":
+            np.divide(getattr(self, f"M{axis}"), Iz, out=M_Ei)
+            def_ang = self._integrate(M_Ei, dz, f"def_ang_{axis}")
+            setattr(self, f"def_ang_{axis}", def_ang)
+            setattr(self, f"def_{axis}", self._integrate(def_ang, dz, f"def_{axis}"))
+        self.def_ang = self._magnitude(
+            "def_ang", (self.def_ang_x, self.def_ang_y, self.def_ang_z)
+        )
         self._correct_deflection()
 
+    def _integrate_macaulay(
+        self,
+        points: np.ndarray,
+        forces: Dict[float, Tuple[float, float, float]],
+        diameters=None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Integrais de <s-a>/EI e (z-s)<s-a>/EI de 0 a z, trecho a trecho.
+        # Diametros em lote (..., secoes) resultam em forma (direcoes, ..., pontos)
+        positions = np.array(list(forces.keys()), dtype=float)
+        F = np.array(list(forces.values()), dtype=float)
+        starts = np.array([sec[0] for sec in self.sections], dtype=float)
+        ends = np.append(starts[1:], np.inf)
+        if diameters is None:
+            diameters = [sec[1] for sec in self.sections]
+        EI = self.material.elasticity_module * math.pi * np.asarray(diameters) ** 4 / 64
+
+        z = points[:, None, None]
+        a = positions[None, :, None]
+        lo = np.maximum(starts[None, None, :], a)
+        hi = np.maximum(np.minimum(ends[None, None, :], z), lo)
+        u_lo = lo - a
+        u_hi = hi - a
+        EI = EI[..., None, None, :]
+        slope_terms = (u_hi**2 - u_lo**2) / 2 / EI
+        deflection_terms = (
+            (z - a) * (u_hi**2 - u_lo**2) / 2 - (u_hi**3 - u_lo**3) / 3
+        ) / EI
+
+        # (pontos, cargas) x (cargas, direcoes) -> (direcoes, pontos)
+        slope = np.moveaxis(slope_terms.sum(axis=-1) @ F, -1, 0)
+        deflection = np.moveaxis(deflection_terms.sum(axis=-1) @ F, -1, 0)
+        return slope, deflection
+
+    def _balance(
+        self, forces: Dict[float, Tuple[float, float, float]]
+    ) -> Dict[float, Tuple[float, float, float]]:
+        # Acrescenta as reacoes nos mancais que equilibram as cargas dadas
+        # (nulas quando as reacoes ja estao incluidas, como em acting_forces)
+        s0, s1 = self.correction_points
+        F = np.array(list(forces.values()), dtype=float)
+        positions = np.array(list(forces.keys()), dtype=float)
+        R1 = -(F * (positions - s0)[:, None]).sum(axis=0) / (s1 - s0)
+        R0 = -F.sum(axis=0) - R1
+        balanced = dict(forces)
+        for position, reaction in ((s0, R0), (s1, R1)):
+            previous = np.asarray(balanced.get(position, (0, 0, 0)), dtype=float)
+            balanced[position] = tuple(previous + reaction)
+        return balanced
+
+    def deflection_at(
+        self,
+        points,
+        forces: Dict[float, Tuple[float, float, float]] = None,
+        diameters=None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Linha elastica analitica (funcoes de singularidade) para EI constante
+        # por trecho, com deflexao nula nos mancais (correction_points)
+        forces = self.acting_forces if forces is None else forces
+        points = np.atleast_1d(np.asarray(points, dtype=float))
+        supports = np.array(self.correction_points, dtype=float)
+        forces = self._balance(forces)
+
+        slope0, deflection0 = self._integrate_macaulay(points, forces, diameters)
+        _, support_deflection = self._integrate_macaulay(supports, forces, diameters)
+        C1 = -(support_deflection[..., 1] - support_deflection[..., 0]) / (
+            supports[1] - supports[0]
+        )
+        C2 = -support_deflection[..., 0] - C1 * supports[0]
+
+        slope = slope0 + C1[..., None]
+        deflection = deflection0 + C1[..., None] * points + C2[..., None]
+        return slope, deflection
+
+    def section_index(self, points) -> np.ndarray:
+        starts = np.array([sec[0] for sec in self.sections], dtype=float)
+        return np.searchsorted(starts, np.asarray(points, dtype=float), "right") - 1
+
+    def moments_at(
+        self,
+        points,
+        forces: Dict[float, Tuple[float, float, float]] = None,
+    ) -> np.ndarray:
+        # Momentos (Mx, My, Mz) por funcoes de Macaulay nos pontos pedidos.
+        # Forcas em lote (arrays) resultam em forma (direcoes, lote, pontos)
+        forces = self.acting_forces if forces is None else forces
+        points = np.atleast_1d(np.asarray(points, dtype=float))
+        positions = np.array(list(forces.keys()), dtype=float)
+        components = np.broadcast_arrays(
+            *[np.asarray(c, dtype=float) for force in forces.values() for c in force]
+        )
+        F = np.stack(components, axis=-1).reshape(
+            components[0].shape + (len(forces), 3)
+        )
+        arm = points[:, None] - positions[None, :]
+        arm = np.where(arm >= 0, arm, 0)
+        return np.moveaxis(np.einsum("km,...md->...dk", arm, F), -2, 0)
+
+    def stress_at(
+        self,
+        points,
+        moments: np.ndarray,
+        Diam=None,
+        material: Material = None,
+        Torque=None,
+    ) -> "Shaft":
+        # Copia do eixo restrita aos pontos pedidos; aceita arrays em lote
+        # (ultimo eixo = pontos) ou numeros duais no diametro
+        sample = copy.copy(self)
+        sample.workspace = None
+        sample.z = np.atleast_1d(np.asarray(points, dtype=float))
+        sample.Diam = (
+            np.array([sec[1] for sec in self.sections])[self.section_index(sample.z)]
+            if Diam is None
+            else Diam
+        )
+        sample.I = math.pi * sample.Diam**4 / 64
+        sample.J = math.pi * sample.Diam**4 / 32
+        sample.Mx, sample.My, sample.Mz = moments
+        sample.M = (sample.Mx**2 + sample.My**2 + sample.Mz**2) ** 0.5
+        if material is not None:
+            sample.material = material
+        if Torque is not None:
+            sample.Torque = Torque
+        sample.calculate_stress()
+        return sample
+
     def calculate_acting_forces(self):
-        def _macaulay(x: float, n: float, direction: int) -> float:
-            result = 0
-            for a, force in self.acting_forces.items():
-                if x >= a:
-                    result += force[direction] * (x - a) ** n
-            return result
-
-        self.Vx = [_macaulay(x=x, n=0, direction=0) for x in self.z]
-        self.Mx = [_macaulay(x=x, n=1, direction=0) for x in self.z]
-
-        self.Vy = [_macaulay(x=x, n=0, direction=1) for x in self.z]
-        self.My = [_macaulay(x=x, n=1, direction=1) for x in self.z]
-
-        self.Vz = [_macaulay(x=x, n=0, direction=2) for x in self.z]
-        self.Mz = [_macaulay(x=x, n=1, direction=2) for x in self.z]
-
-        self.V = [
-            (vx**2 + vy**2 + vz**2) ** 0.5
-            for vx, vy, vz in zip(self.Vx, self.Vy, self.Vz)
-        ]
-        self.M = [
-            (mx**2 + my**2 + mz**2) ** 0.5
-            for mx, my, mz in zip(self.Mx, self.My, self.Mz)
-        ]
+        # Funcoes de Macaulay: <z-a>^0 para o cortante e <z-a>^1 para o momento
+        shear = [self._empty(name) for name in ("Vx", "Vy", "Vz")]
+        moment = [self._empty(name) for name in ("Mx", "My", "Mz")]
+        for array in shear + moment:
+            array.fill(0)
+        arm = self._empty("scratch0")
+        term = self._empty("scratch1")
+        z = self._exact_grid()
+        for a, force in self.acting_forces.items():
+            loaded = z >= a
+            np.subtract(self.z, a, out=arm)
+            for direction in range(3):
+                np.add(
+                    shear[direction],
+                    force[direction],
+                    out=shear[direction],
+                    where=loaded,
+                )
+                np.multiply(force[direction], arm, out=term)
+                np.add(moment[direction], term, out=moment[direction], where=loaded)
+
+        self.Vx, self.Vy, self.Vz = shear
+        self.Mx, self.My, self.Mz = moment
+        self.V = self._magnitude("V", shear)
+        self.M = self._magnitude("M", moment)
         self._calculate_deflection()
 
     def _evaluate_fatigue(self):
         self.tensao_alt = self.sigma
-        self.tensao_med = (self.tau_xy * 3) ** 0.5
-        Cs = 1.189 * (self.Diam * 1000) ** (-0.097)
+        tensao_med = np.multiply(self.tau_xy, 3, out=self._buffer("tensao_med"))
+        self.tensao_med = np.sqrt(tensao_med, out=tensao_med)
+        Cs = np.multiply(self.Diam, 1000, out=self._buffer("Cs"))
+        Cs = np.power(Cs, -0.097, out=Cs)
+        Cs = np.multiply(1.189, Cs, out=Cs)
         Ce = 1
-        Cf = min(1, 4.51 * (self.material.ultimate_stress / 10e6) ** (-0.265))
+        Cf = np.minimum(1, 4.51 * (self.material.ultimate_stress / 10e6) ** (-0.265))
         Ct = 1
         Cr = 0.868
-        tensao_fad = 0.5 * self.material.ultimate_stress * Cs * Ce * Cf * Ct * Cr
+        tensao_fad = np.multiply(
+            0.5 * self.material.ultimate_stress, Cs, out=self._buffer("tensao_fad")
+        )
+        for factor in (Ce, Cf, Ct, Cr):
+            tensao_fad = np.multiply(tensao_fad, factor, out=tensao_fad)
         print(np.mean(Cs), Ce, Cf, Ct, Cr)
         # Linha de carga 3
-        self.N_fad = (
-            tensao_fad
-            * self.material.ultimate_stress
-            / (
-                self.tensao_alt * self.material.ultimate_stress
-                + self.tensao_med * tensao_fad
-            )
+        N_fad = np.multiply(
+            tensao_fad, self.material.ultimate_stress, out=self._buffer("N_fad")
+        )
+        denominator = np.multiply(
+            self.tensao_alt,
+            self.material.ultimate_stress,
+            out=self._buffer("scratch0"),
         )
+        term = np.multiply(self.tensao_med, tensao_fad, out=self._buffer("scratch1"))
+        denominator = np.add(denominator, term, out=denominator)
+        self.N_fad = np.divide(N_fad, denominator, out=N_fad)
+
+    def _notch_sensitivity(self, neuber_constant: float, name: str) -> np.ndarray:
+        q = np.divide(self.Diam, 2, out=self._buffer(name))
+        q = np.sqrt(q, out=q)
+        q = np.divide(neuber_constant, q, out=q)
+        q = np.add(1, q, out=q)
+        return np.divide(1, q, out=q)
+
+    def _concentration_factor(
+        self, Kt: float, column: int, q: np.ndarray, name: str
+    ) -> np.ndarray:
+        # Kf = 1 + q (Kt - 1) nos trechos de stress_focus, Kt = 0 fora deles.
+        # Trechos [inicio, fim, Kt, Kts] trazem o proprio fator
+        Kf = self._empty(name)
+        Kf.fill(0)
+        z = self._exact_grid()
+        for focus in self.stress_focus:
+            value = focus[column] if len(focus) > column else Kt
+            Kf[(z >= focus[0]) & (z <= focus[1])] = value
+        Kf = np.subtract(Kf, 1, out=Kf)
+        Kf = np.multiply(q, Kf, out=Kf)
+        return np.add(1, Kf, out=Kf)
 
     def _evaluate_stress_focus(self):
-        q = 1 / (1 + self.material.neuber_constant / ((self.Diam / 2) ** 0.5))
-        qs = 1 / (1 + self.material.neuber_constant_shear / ((self.Diam / 2) ** 0.5))
+        q = self._notch_sensitivity(self.material.neuber_constant, "q")
+        qs = self._notch_sensitivity(self.material.neuber_constant_shear, "qs")
 
         # Chavetas
         Ktc = 2.1
         Ktsc = 3.0
-        Kt = []
-        Kts = []
-        for pos in self.z:
-            kt = 0
-            kts = 0
-            for focus in self.stress_focus:
-                kt = Ktc if pos >= focus[0] and pos <= focus[1] else kt
-                kts = Ktsc if pos >= focus[0] and pos <= focus[1] else kts
-
-            Kt.append(kt)
-            Kts.append(kts)
-
-        Kf = 1 + q * (np.array(Kt) - 1)
-        Kfs = 1 + qs * (np.array(Kts) - 1)
-        self.sigma_x = self.sigma_x * Kf
-        self.sigma_y = self.sigma_y * Kf
-        self.sigma_z = self.sigma_z * Kf
-        self.sigma = self.sigma * Kf
-        self.tau_xy = self.tau_xy * Kfs
+        Kf = self._concentration_factor(Ktc, 2, q, "Kf")
+        Kfs = self._concentration_factor(Ktsc, 3, qs, "Kfs")
+        self.sigma_x = np.multiply(self.sigma_x, Kf, out=self.sigma_x)
+        self.sigma_y = np.multiply(self.sigma_y, Kf, out=self.sigma_y)
+        self.sigma_z = np.multiply(self.sigma_z, Kf, out=self.sigma_z)
+        self.sigma = np.multiply(self.sigma, Kf, out=self.sigma)
+        self.tau_xy = np.multiply(self.tau_xy, Kfs, out=self.tau_xy)
 
         # Criterio de falha estatico
-        self.sigma_eq = (
-            (
-                (self.sigma_x - self.sigma_y) ** 2
-                + self.sigma_x**2
-                + self.sigma_y**2
-                + 6 * self.tau_xy**2
-            )
-            / 2
-        ) ** 0.5
-        self.N_est = self.material.yield_stress / self.sigma_eq
+        sigma_eq = np.subtract(self.sigma_x, self.sigma_y, out=self._buffer("sigma_eq"))
+        sigma_eq = np.square(sigma_eq, out=sigma_eq)
+        term = np.square(self.sigma_x, out=self._buffer("scratch0"))
+        sigma_eq = np.add(sigma_eq, term, out=sigma_eq)
+        term = np.square(self.sigma_y, out=term)
+        sigma_eq = np.add(sigma_eq, term, out=sigma_eq)
+        term = np.square(self.tau_xy, out=term)
+        term = np.multiply(6, term, out=term)
+        sigma_eq = np.add(sigma_eq, term, out=sigma_eq)
+        sigma_eq = np.divide(sigma_eq, 2, out=sigma_eq)
+        self.sigma_eq = np.sqrt(sigma_eq, out=sigma_eq)
+        self.N_est = np.divide(
+            self.material.yield_stress, self.sigma_eq, out=self._buffer("N_est")
+        )
 
         self._evaluate_fatigue()
 
+    def _bending_stress(self, moment: np.ndarray, two_I: np.ndarray, name: str):
+        sigma = np.multiply(moment, self.Diam, out=self._buffer(name))
+        return np.divide(sigma, two_I, out=sigma)
+
     def calculate_stress(self):
-        self.sigma_x = self.Mx * self.Diam / (2 * self.I)
-        self.sigma_y = self.My * self.Diam / (2 * self.I)
-        self.sigma_z = self.Mz * self.Diam / (2 * self.I)
-        self.sigma = self.M * self.Diam / (2 * self.I)
-        self.tau_xy = self.Torque * self.Diam / (2 * self.J)
+        # Com workspace os campos sao calculados nos buffers, sem alocacao
+        two_I = np.multiply(2, self.I, out=self._buffer("scratch0"))
+        self.sigma_x = self._bending_stress(self.Mx, two_I, "sigma_x")
+        self.sigma_y = self._bending_stress(self.My, two_I, "sigma_y")
+        self.sigma_z = self._bending_stress(self.Mz, two_I, "sigma_z")
+        self.sigma = self._bending_stress(self.M, two_I, "sigma")
+        two_J = np.multiply(2, self.J, out=self._buffer("scratch1"))
+        tau_xy = np.multiply(self.Torque, self.Diam, out=self._buffer("tau_xy"))
+        self.tau_xy = np.divide(tau_xy, two_J, out=tau_xy)
 
         self._evaluate_stress_focus()
 
     def export_plots(self):
+        # Importado aqui para nao pagar o custo do matplotlib sem graficos
+        import matplotlib.pyplot as plt
+
         x = self.z * 1000
         mx = [mx * 1000 for mx in self.Mx]
         my = [my * 1000 for my in self.My]
@@ -0,0 +1,111 @@
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+from redutor.Shaft import Shaft
+
+
+class ShaftDynamics:
+    # Velocidade critica de flexao (Rayleigh e Dunkerley) pela linha elastica
+    # do eixo e rigidez torcional sobre a malha. Massas, velocidade e
+    # diametros aceitam arrays: o eixo final de `diameters` sao as secoes,
+    # os anteriores o lote.
+    def __init__(
+        self,
+        shaft: Shaft,
+        masses: Dict[float, float],
+        speed: float,
+        span: Tuple[float, float],
+        diameters=None,
+        include_shaft_mass: bool = True,
+        g: float = 9.81,
+    ) -> None:
+        self.shaft = shaft
+        self.masses = masses
+        self.speed = speed  # rad/s
+        self.span = sorted(span)
+        self.diameters = (
+            np.array([sec[1] for sec in shaft.sections])
+            if diameters is None
+            else np.asarray(diameters)
+        )
+        self.include_shaft_mass = include_shaft_mass
+        self.g = g
+
+    def _grid(self):
+        z = np.asarray(self.shaft.z, dtype=float)
+        # Pesos da regra do trapezio na malha
+        dz = np.diff(z)
+        self.weights = np.zeros_like(z)
+        self.weights[:-1] += dz / 2
+        self.weights[1:] += dz / 2
+        self.Diam = self.diameters[..., self.shaft.section_index(z)]
+        self.GJ = self.shaft.material.stiffness_module * math.pi * self.Diam**4 / 32
+
+    def influence_matrix(self, positions) -> np.ndarray:
+        # Coeficientes de influencia a_ij: deflexao em i por carga unitaria
+        # em j, pela linha elastica do eixo. Forma (..., n, n)
+        positions = np.atleast_1d(np.asarray(positions, dtype=float))
+        columns = [
+            self.shaft.deflection_at(
+                positions, forces={position: (0, 1, 0)}, diameters=self.diameters
+            )[1][1]
+            for position in positions
+        ]
+        return np.stack(columns, axis=-1)
+
+    def _lumped_masses(self) -> Tuple[np.ndarray, np.ndarray]:
+        positions = list(self.masses.keys())
+        masses = list(self.masses.values())
+        if self.include_shaft_mass:
+            # Cada trecho do eixo concentrado no seu ponto medio
+            starts = [sec[0] for sec in self.shaft.sections]
+            ends = starts[1:] + [self.shaft.length]
+            density = self.shaft.material.density
+            for k, (start, end) in enumerate(zip(starts, ends)):
+                positions.append((start + end) / 2)
+                masses.append(
+                    density * math.pi / 4 * self.diameters[..., k] ** 2 * (end - start)
+                )
+        masses = np.stack(np.broadcast_arrays(*masses), axis=-1)
+        return np.array(positions, dtype=float), masses
+
+    def calculate_critical_speed(self):
+        positions, m = self._lumped_masses()
+        a = self.influence_matrix(positions)
+        # Deflexao estatica sob o peso das massas
+        y = self.g * np.einsum("...ij,...j->...i", a, m)
+        self.static_deflection = y
+        self.rayleigh = np.sqrt(
+            self.g * np.sum(m * y, axis=-1) / np.sum(m * y**2, axis=-1)
+        )
+        self.dunkerley = 1 / np.sqrt(
+            np.sum(m * np.diagonal(a, axis1=-2, axis2=-1), axis=-1)
+        )
+        # Dunkerley e limite inferior: usado na verificacao
+        self.critical_speed = self.dunkerley
+        self.critical_rpm = self.critical_speed * 30 / math.pi
+        self.speed_ratio = self.speed / self.critical_speed
+
+    def calculate_torsion(self):
+        z = np.asarray(self.shaft.z, dtype=float)
+        inside = (z >= self.span[0]) & (z <= self.span[1])
+        flexibility = np.sum(self.weights * inside / self.GJ, axis=-1)
+        self.torsional_stiffness = 1 / flexibility  # N.m/rad
+        self.twist = self.shaft.Torque * flexibility  # rad
+        self.twist_rate = np.degrees(self.twist) / (self.span[1] - self.span[0])
+
+    def calculate(self):
+        self._grid()
+        self.calculate_critical_speed()
+        self.calculate_torsion()
+
+    def print_report(self):
+        print(f"{self.shaft.label}")
+        print(f"Velocidade critica (Rayleigh): {self.rayleigh * 30 / math.pi} rpm")
+        print(f"Velocidade critica (Dunkerley): {self.dunkerley * 30 / math.pi} rpm")
+        print(f"Rotacao / velocidade critica: {self.speed_ratio}")
+        print(f"Rigidez torcional: {self.torsional_stiffness} N.m/rad")
+        print(f"Angulo de torcao: {np.degrees(self.twist)} graus")
+        print(f"Torcao por comprimento: {self.twist_rate} graus/m")
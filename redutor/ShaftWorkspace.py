@@ -0,0 +1,65 @@
+import numpy as np
+
+
+class ShaftWorkspace:
+    # Um unico bloco (campos x pontos) reaproveitado por varios eixos.
+    # Os campos de um eixo sao sobrescritos pelo proximo que usar o workspace;
+    # `owner` e o eixo dono dos valores atuais, o anterior perde os campos.
+    FIELDS = (
+        "Vx",
+        "Vy",
+        "Vz",
+        "V",
+        "Mx",
+        "My",
+        "Mz",
+        "M",
+        "def_ang_x",
+        "def_ang_y",
+        "def_ang_z",
+        "def_x",
+        "def_y",
+        "def_z",
+        "def_ang",
+        "def_tot_cor_x",
+        "def_tot_cor_y",
+        "def_tot_cor_z",
+        "def_tot_cor",
+        "def_ang_cor_x",
+        "def_ang_cor_y",
+        "def_ang_cor_z",
+        "def_ang_cor",
+        "sigma_x",
+        "sigma_y",
+        "sigma_z",
+        "sigma",
+        "tau_xy",
+        "sigma_eq",
+        "N_est",
+        "tensao_med",
+        "tensao_fad",
+        "Cs",
+        "N_fad",
+        "q",
+        "qs",
+        "Kf",
+        "Kfs",
+        "scratch0",
+        "scratch1",
+        "scratch2",
+    )
+
+    def __init__(self, size: int = 0, dtype=np.float64) -> None:
+        self.dtype = np.dtype(dtype)
+        self._index = {name: i for i, name in enumerate(self.FIELDS)}
+        self.buffer = np.empty((len(self.FIELDS), size), dtype=self.dtype)
+        self.owner = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.buffer.nbytes
+
+    def field(self, name: str, size: int) -> np.ndarray:
+        if size > self.buffer.shape[1]:
+            self.buffer = np.empty((len(self.FIELDS), size), dtype=self.dtype)
+        return self.buffer[self._index[name], :size]
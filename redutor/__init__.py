@@ -1,17 +1,38 @@
 __all__ = [
+    "BearingSelection",
     "Gear",
+    "Gearbox",
     "Shaft",
+    "ShaftWorkspace",
+    "ShaftDynamics",
     "SystemVariables",
     "Material",
     "Pulley",
     "PulleyTransmission",
     "GearTransmission",
+    "Keyway",
+    "Design",
+    "Dual",
+    "ResultCache",
+    "Reliability",
+    "EvaluationService",
 ]
 
+from .BearingSelection import BearingSelection
+from .Dual import Dual
 from .Gear import Gear
+from .Gearbox import Gearbox
 from .GearTransmission import GearTransmission
+from .Keyway import Keyway
 from .Material import Material
 from .Pulley import Pulley
 from .PulleyTransmission import PulleyTransmission
+from .ResultCache import ResultCache
 from .Shaft import Shaft
+from .ShaftDynamics import ShaftDynamics
+from .ShaftWorkspace import ShaftWorkspace
 from .SystemVariables import SystemVariables
+
+from .Design import Design  # isort: skip
+from .Reliability import Reliability  # isort: skip
+from .EvaluationService import EvaluationService  # isort: skip
@@ -0,0 +1,42 @@
+import numpy as np
+
+from redutor import BearingSelection
+
+
+def _select(load, bore=0.017, speed=1000.0, life=10_000.0):
+    selection = BearingSelection(bore, load, speed, life)
+    selection.select()
+    return selection
+
+
+def test_bore_range_lightest_first():
+    selection = _select([0.0, 700.0, 1000.0, 1500.0, 2500.0])
+    # Furo de 17 mm: so 6003/6203/6303/6403, do mais leve ao mais pesado
+    assert list(selection.designations[selection.d == 0.017]) == [
+        "6003",
+        "6203",
+        "6303",
+        "6403",
+    ]
+    assert list(selection.designation) == ["6003", "6003", "6203", "6303", "6403"]
+    assert selection.valid.all()
+
+
+def test_life_formula():
+    selection = _select(700.0)
+    # L10h = 10^6 / (60 n) (C / P)^3 com C = 6,37 kN do 6003
+    np.testing.assert_allclose(selection.L10h, 1e6 / (60 * 1000) * (6370 / 700) ** 3)
+    np.testing.assert_allclose(selection.static_factor, 3250 / 700)
+    assert selection.mass == 0.039
+
+
+def test_no_bearing_qualifies():
+    # 6404 (20 mm) atenderia, mas esta fora da faixa do furo de 17 mm
+    selection = _select([700.0, 3000.0])
+    assert list(selection.valid) == [True, False]
+    assert selection.designation[1] == ""
+    assert selection.index[1] == -1
+    assert np.isnan(selection.L10h[1])
+    assert np.isnan(selection.mass[1])
+    assert np.isnan(selection.static_factor[1])
+    assert not _select(700.0, bore=0.018).valid
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import os
+
+from redutor.EvaluationService import EvaluationService, evaluate_remote
+
+REFERENCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "designs",
+    "reference.json",
+)
+
+
+async def _send(port, lines):
+    # Linhas cruas numa conexao; respostas na ordem em que chegam
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"".join(line + b"\n" for line in lines))
+    await writer.drain()
+    writer.write_eof()
+    responses = [json.loads(line) async for line in reader]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+
+def _run(line_limit, client):
+    async def main():
+        service = EvaluationService(port=0, workers=1, line_limit=line_limit)
+        await service.start()
+        try:
+            return await client(service.port)
+        finally:
+            await service.close()
+
+    return asyncio.run(main())
+
+
+def _design():
+    with open(REFERENCE, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_evaluate_remote_returns_summary():
+    responses = _run(2**20, lambda port: evaluate_remote([_design()], port=port))
+    assert [response["status"] for response in responses] == ["ok"]
+    assert responses[0]["id"] == 0
+    assert set(responses[0]["result"]["shafts"]) == {
+        spec["label"] for spec in _design()["shafts"]
+    }
+
+
+def test_bad_requests_get_error_replies():
+    valid = json.dumps({"id": "ok", "design": _design(), "outputs": ["reactions"]})
+    # Cerca de 100 KB: acima do limite do servico neste teste
+    oversized = json.dumps({"id": "big", "padding": "x" * 100_000})
+    lines = [b"[1, 2]", b"{bad", oversized.encode(), valid.encode()]
+    responses = _run(2**16, lambda port: _send(port, lines))
+
+    assert len(responses) == 4
+    errors = sorted(r["error"] for r in responses if r["status"] == "error")
+    assert len(errors) == 3
+    assert errors[0].startswith("JSON invalido")
+    assert errors[1] == "pedido deve ser um objeto"
+    assert errors[2] == f"pedido maior que {2**16} bytes"
+    # O pedido seguinte na mesma conexao continua sendo atendido
+    assert [r["id"] for r in responses if r["status"] == "ok"] == ["ok"]
+
+
+def test_default_limit_accepts_large_requests():
+    request = {"id": 1, "design": _design(), "padding": "x" * 100_000}
+    responses = _run(
+        EvaluationService().line_limit,
+        lambda port: _send(port, [json.dumps(request).encode()]),
+    )
+    assert [(r["id"], r["status"]) for r in responses] == [(1, "ok")]
@@ -0,0 +1,38 @@
+import json
+import os
+
+import numpy as np
+
+from redutor import Golden
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_reference_design_matches_golden():
+    # Mesma verificacao de checkGolden.py, nas duas avaliacoes
+    with open(
+        os.path.join(ROOT, "designs", "reference.json"), encoding="utf-8"
+    ) as file:
+        data = json.load(file)
+    fields = Golden.capture_reference(data)
+    reference = Golden.load(os.path.join(ROOT, "golden", "reference.npz"))
+    assert Golden.compare(reference, fields) == []
+    assert any(name.startswith("feedback.") for name in fields)
+
+
+def test_compare_is_elementwise():
+    # O maximo do campo nao pode esconder a mudanca do minimo
+    reference = {"Eixo 3.N_fad": np.array([0.995, 2.0, 42980.0])}
+    current = {"Eixo 3.N_fad": np.array([1.293, 2.0, 42980.0])}
+    failures = Golden.compare(reference, current, rtol=1e-5)
+    assert len(failures) == 1 and failures[0].startswith("Eixo 3.N_fad: 1 de 3")
+
+
+def test_zero_crossing_uses_absolute_floor():
+    reference = {"Eixo 1.Mx": np.array([-100.0, 0.0, 100.0])}
+    current = {"Eixo 1.Mx": np.array([-100.0, 1e-12, 100.0])}
+    assert Golden.compare(reference, current) == []
+    current = {"Eixo 1.Mx": np.array([-100.0, 1e-3, 100.0])}
+    assert len(Golden.compare(reference, current)) == 1
+    # Tolerancia dada pelo usuario tem prioridade sobre o piso
+    assert Golden.compare(reference, current, tolerances={"*.Mx": (0, 1e-2)}) == []
@@ -0,0 +1,67 @@
+import contextlib
+import io
+import json
+import os
+
+import numpy as np
+import pytest
+
+from redutor import Design, Keyway
+
+REFERENCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "designs",
+    "reference.json",
+)
+
+
+def _keyway(diameter, length=0.03, torque=50.0, yield_stress=300e6):
+    keyway = Keyway(diameter, length, torque, yield_stress)
+    keyway.calculate()
+    return keyway
+
+
+def test_din_6885_range_edges():
+    keyway = _keyway([0.006, 0.0061, 0.017, 0.017001, 0.065, 0.065001])
+    # Faixas "acima de ... ate ...": 17 mm ainda e 5 x 5, logo acima 6 x 6
+    assert list(keyway.valid) == [False, True, True, True, True, False]
+    np.testing.assert_allclose(keyway.b[1:5], [0.002, 0.005, 0.006, 0.018])
+    np.testing.assert_allclose(keyway.h[1:5], [0.002, 0.005, 0.006, 0.011])
+    np.testing.assert_allclose(keyway.t1[2:4], [0.003, 0.0035])
+
+
+def test_shear_and_crushing():
+    d, L, T, Sy = 0.017, 0.03, 50.0, 300e6
+    keyway = _keyway(d, L, T, Sy)
+    # b = h = 5 mm e t1 = 3 mm: cisalhamento 2T/(d b L), esmagamento 2T/(d L (h - t1))
+    tau = 2 * T / (d * 0.005 * L)
+    sigma = 2 * T / (d * L * (0.005 - 0.003))
+    np.testing.assert_allclose(keyway.tau, tau)
+    np.testing.assert_allclose(keyway.sigma, sigma)
+    np.testing.assert_allclose(keyway.N_shear, 0.577 * Sy / tau)
+    np.testing.assert_allclose(keyway.N_bearing, Sy / sigma)
+    # r = 0,25 mm: r/d = 0,0147 entre 0,01 e 0,02 na tabela de Peterson
+    np.testing.assert_allclose(
+        keyway.Kt, np.interp(0.00025 / d, [0.01, 0.02], [2.45, 2.14])
+    )
+    np.testing.assert_allclose(
+        keyway.Kts, np.interp(0.00025 / d, [0.01, 0.02], [3.5, 3.0])
+    )
+
+
+def test_batched_keys_do_not_feed_back_silently():
+    with open(REFERENCE, encoding="utf-8") as file:
+        design = Design(json.load(file))
+    with contextlib.redirect_stdout(io.StringIO()):
+        design.calculate_transmissions(report=False)
+        design.calculate_reactions()
+    # Varredura do diametro de um assento: um Kt por projeto do lote
+    shaft = next(iter(design.shafts.values()))
+    focus = shaft.stress_focus[0]
+    index = shaft.section_index((focus[0] + focus[1]) / 2)
+    shaft.sections[index][1] = shaft.sections[index][1] * np.array([1.0, 1.2])
+
+    design.calculate_keys(feedback=False, report=False)
+    assert design.keys.Kt.shape[0] == 2
+    with pytest.raises(ValueError):
+        design.calculate_keys(report=False)
@@ -0,0 +1,78 @@
+import json
+import os
+
+import numpy as np
+
+from redutor import Design
+from redutor.ResultCache import ResultCache
+
+REFERENCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "designs",
+    "reference.json",
+)
+
+
+def test_key_is_stable():
+    inputs = {"length": 0.16, "sections": [[0.0, 0.017], [0.02, 0.02]]}
+    # Valor fixo: uma mudanca aqui invalida todos os caches existentes
+    assert (
+        ResultCache.key("shaft", inputs)
+        == "6cd87e705af5f6adb858cd9dbd14cbcf0298c80a551bc3aafe940773a6e78544"
+    )
+    reordered = {"sections": np.array([[0, 0.017], [0.02, 0.02]]), "length": 0.16}
+    assert ResultCache.key("shaft", reordered) == ResultCache.key("shaft", inputs)
+    assert ResultCache.key("gear_stress", inputs) != ResultCache.key("shaft", inputs)
+    assert ResultCache.key("shaft", {**inputs, "length": 0.17}) != ResultCache.key(
+        "shaft", inputs
+    )
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    rng = np.random.default_rng(0)
+    for i, key in enumerate(("a", "b")):
+        cache.store(key, {"values": rng.random(1000)})
+        os.utime(cache._path(key), (i + 1, i + 1))
+    size = os.path.getsize(cache._path("a"))
+
+    # "a" e lido por ultimo; "b" passa a ser o mais antigo
+    assert cache.load("a") is not None
+    cache.max_bytes = int(2.5 * size)
+    cache.store("c", {"values": rng.random(1000)})
+
+    assert os.path.exists(cache._path("a"))
+    assert not os.path.exists(cache._path("b"))
+    assert os.path.exists(cache._path("c"))
+    assert cache.load("b") is None
+
+
+def _fields(design):
+    stages = {**design.transmissions, **design.shafts}
+    return {
+        f"{name}.{attribute}": value
+        for name, stage in stages.items()
+        for attribute, value in vars(stage).items()
+        if isinstance(value, (float, int, np.ndarray))
+    }
+
+
+def test_hit_restores_identical_results(tmp_path):
+    with open(REFERENCE, encoding="utf-8") as file:
+        data = json.load(file)
+    cache = ResultCache(str(tmp_path))
+
+    first = Design(data, cache=cache)
+    first.evaluate(outputs=["stresses"])
+    assert (cache.hits, cache.misses) == (0, 10)
+
+    second = Design(data, cache=cache)
+    second.evaluate(outputs=["stresses"])
+    assert (cache.hits, cache.misses) == (10, 10)
+    assert cache.hit_rate == 0.5
+
+    expected = _fields(first)
+    restored = _fields(second)
+    assert expected.keys() == restored.keys()
+    for name, value in expected.items():
+        np.testing.assert_array_equal(restored[name], value, err_msg=name)
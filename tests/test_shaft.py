@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+
+from redutor import Material, Shaft
+
+STEEL = Material(
+    elasticity_module=200e9,
+    poisson_coef=0.3,
+    yield_stress=580e6,
+    ultimate_stress=690e6,
+    bending_stress_strength=230e6,
+    contact_stress_strength=700e6,
+)
+
+
+def _simply_supported(load: float, length: float = 0.2, diameter: float = 0.02):
+    # Bi-apoiada nas extremidades, carga no meio do vao e reacoes incluidas
+    return Shaft(
+        length=length,
+        resolution=1000,
+        material=STEEL,
+        sections=[[0, diameter]],
+        acting_forces={
+            0: (0, -load / 2, 0),
+            length / 2: (0, load, 0),
+            length: (0, -load / 2, 0),
+        },
+        label="viga",
+        correction_points=[0, length],
+        Torque=0,
+        stress_focus=[],
+    )
+
+
+def test_deflection_matches_closed_form():
+    P, L, d = 1000.0, 0.2, 0.02
+    EI = STEEL.elasticity_module * math.pi * d**4 / 64
+    shaft = _simply_supported(P, L, d)
+
+    slope, deflection = shaft.deflection_at([0, L / 4, L / 2, L])
+    # y(L/2) = P L^3 / 48 EI, y(L/4) = 11 P L^3 / 768 EI, theta(0) = P L^2 / 16 EI
+    np.testing.assert_allclose(
+        deflection[1],
+        [0, 11 * P * L**3 / (768 * EI), P * L**3 / (48 * EI), 0],
+        atol=1e-15,
+    )
+    np.testing.assert_allclose(slope[1, 0], P * L**2 / (16 * EI))
+    np.testing.assert_allclose(deflection[[0, 2]], 0)
+
+
+def test_unbalanced_loads_get_support_reactions():
+    P, L = 1000.0, 0.2
+    shaft = _simply_supported(P, L)
+    # Apenas a carga: as reacoes nos mancais sao acrescentadas
+    _, expected = shaft.deflection_at([L / 4, L / 2])
+    _, deflection = shaft.deflection_at([L / 4, L / 2], forces={L / 2: (0, P, 0)})
+    np.testing.assert_allclose(deflection, expected)
+
+
+def test_grid_deflection_uses_analytic_elastic_line():
+    shaft = _simply_supported(1000.0)
+    shaft.calculate_acting_forces()
+    slope, deflection = shaft.deflection_at(shaft.z)
+    np.testing.assert_allclose(shaft.def_tot_cor_y, deflection[1])
+    np.testing.assert_allclose(shaft.def_ang_cor_y, slope[1])
+
+
+def test_float32_grid_keeps_shoulders_in_their_section():
+    # Ressalto em z = 0.02: em float32 o ponto cairia no trecho anterior
+    kwargs = dict(
+        length=0.16,
+        resolution=1000,
+        material=STEEL,
+        sections=[[0, 0.017], [0.02, 0.02], [0.14, 0.023]],
+        acting_forces={0.01: (0, 500, 0), 0.08: (0, -1000, 0), 0.15: (0, 500, 0)},
+        label="eixo",
+        correction_points=[0.01, 0.15],
+        Torque=50,
+        stress_focus=[[0.02, 0.04]],
+    )
+    exact = Shaft(**kwargs)
+    single = Shaft(**kwargs, dtype=np.float32)
+    np.testing.assert_array_equal(single.Diam, exact.Diam.astype(np.float32))
+    for shaft in (exact, single):
+        shaft.calculate_acting_forces()
+        shaft.calculate_stress()
+    assert single.N_est.dtype == np.float32
+    np.testing.assert_allclose(single.N_est, exact.N_est, rtol=1e-5)
@@ -0,0 +1,34 @@
+import math
+
+import numpy as np
+from test_shaft import STEEL, _simply_supported
+
+from redutor import ShaftDynamics
+
+
+def test_influence_matches_closed_form():
+    L, d = 0.2, 0.02
+    EI = STEEL.elasticity_module * math.pi * d**4 / 64
+    shaft = _simply_supported(1000.0, L, d)
+    dynamics = ShaftDynamics(shaft, {L / 2: 1.0}, speed=100, span=(0, L))
+
+    a = dynamics.influence_matrix([L / 4, L / 2])
+    # a(L/2, L/2) = L^3 / 48 EI e a(L/4, L/2) = 11 L^3 / 768 EI (simetrica)
+    np.testing.assert_allclose(a[1, 1], L**3 / (48 * EI))
+    np.testing.assert_allclose(a[0, 1], 11 * L**3 / (768 * EI))
+    np.testing.assert_allclose(a, a.T)
+
+
+def test_batched_diameters_match_single_evaluation():
+    shaft = _simply_supported(1000.0)
+    diameters = np.array([[0.02], [0.025]])
+    batch = ShaftDynamics(
+        shaft, {0.1: 2.0}, speed=100, span=(0, 0.2), diameters=diameters
+    )
+    batch.calculate()
+    for k, diameter in enumerate(diameters):
+        single = ShaftDynamics(
+            shaft, {0.1: 2.0}, speed=100, span=(0, 0.2), diameters=diameter
+        )
+        single.calculate()
+        np.testing.assert_allclose(batch.critical_rpm[k], single.critical_rpm)
@@ -0,0 +1,103 @@
+import contextlib
+import io
+import json
+import os
+
+import numpy as np
+import pytest
+
+from redutor import Design, ShaftWorkspace
+
+REFERENCE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "designs",
+    "reference.json",
+)
+
+
+@pytest.fixture
+def data():
+    with open(REFERENCE, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _evaluate(shaft):
+    shaft.calculate_acting_forces()
+    shaft.calculate_stress()
+    return {
+        name: np.array(value)
+        for name, value in vars(shaft).items()
+        if isinstance(value, np.ndarray)
+    }
+
+
+def test_shared_workspace_matches_default(data):
+    default = Design(data)
+    default.calculate_transmissions(report=False)
+    default.calculate_reactions()
+    shared = Design(data, workspace=ShaftWorkspace())
+    shared.calculate_transmissions(report=False)
+    shared.calculate_reactions()
+
+    for label, shaft in shared.shafts.items():
+        # Cada eixo e consumido antes do proximo usar o workspace
+        results = _evaluate(shaft)
+        expected = _evaluate(default.shafts[label])
+        assert results.keys() == expected.keys()
+        for name, value in expected.items():
+            np.testing.assert_array_equal(results[name], value, err_msg=name)
+
+
+def test_previous_shaft_releases_its_fields(data):
+    design = Design(data, workspace=ShaftWorkspace())
+    design.calculate_transmissions(report=False)
+    design.calculate_reactions()
+    first, second = list(design.shafts.values())[:2]
+
+    _evaluate(first)
+    N_fad = first.N_fad
+    _evaluate(second)
+    assert design.workspace.owner is second
+    assert not hasattr(first, "N_fad")
+    assert not hasattr(first, "Mx")
+    # Campos fora do workspace continuam validos
+    assert first.z is not None and first.Diam is not None
+    assert np.shares_memory(N_fad, second.N_fad)
+
+
+def test_workspace_dtype_must_match(data):
+    design = Design(data, workspace=ShaftWorkspace(dtype=np.float32))
+    design.calculate_transmissions(report=False)
+    with pytest.raises(ValueError):
+        design.calculate_reactions()
+
+
+def _summary(design, outputs=("reactions", "stresses", "keys")):
+    with contextlib.redirect_stdout(io.StringIO()):
+        design.evaluate(outputs=outputs)
+    return design.summary()
+
+
+def test_evaluate_with_workspace_keeps_results_and_plots(data, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.mkdir("output")
+    expected = _summary(Design(data))
+    # Resultados e graficos de cada eixo saem antes do proximo usar o workspace
+    design = Design(data, workspace=ShaftWorkspace())
+    summary = _summary(design, ("reactions", "stresses", "plots", "keys"))
+    assert summary == expected
+    assert set(summary["shafts"]) == {spec["label"] for spec in data["shafts"]}
+    for label in summary["shafts"]:
+        assert os.path.exists(os.path.join("output", f"{label}_Geometry.png"))
+    with pytest.raises(ValueError):
+        design.export_plots()
+
+
+def test_float32_design(data):
+    expected = _summary(Design(data))["shafts"]
+    design = Design(data, workspace=ShaftWorkspace(dtype=np.float32), dtype=np.float32)
+    shafts = _summary(design)["shafts"]
+    assert next(iter(design.shafts.values())).z.dtype == np.float32
+    for label, results in expected.items():
+        for name in ("N_est", "N_fad"):
+            assert shafts[label][name] == pytest.approx(results[name], rel=1e-5)